@@ -4,7 +4,7 @@ Central Persona Registry
 This file defines all available personas in the system.
 To add a new persona:
 1. Create the worker file (app/workers/{persona_id}_worker.py)
-2. Add the persona prompt to langflow_client.py
+2. Add the persona prompt to app/services/persona_prompts.json
 3. Add an entry to PERSONAS list below
 4. The system will automatically pick it up!
 """
@@ -1,6 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routes import evaluate, segments, audio, re_evaluate, summary
+from app.routes import evaluate, segments, audio, re_evaluate, summary, bundle
 
 app = FastAPI(title="SonicLayer AI Backend")
 
@@ -17,4 +17,5 @@ app.include_router(evaluate.router)
 app.include_router(segments.router)
 app.include_router(audio.router)
 app.include_router(re_evaluate.router)
-app.include_router(summary.router)
\ No newline at end of file
+app.include_router(summary.router)
+app.include_router(bundle.router)
\ No newline at end of file
@@ -1,13 +1,21 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from fastapi.responses import FileResponse
 import os
 
 router = APIRouter()
 
+# When set (e.g. "/protected_audio"), nginx serves the bytes from an internal location
+# and handles Range/seek itself; Python only checks the file exists
+AUDIO_ACCEL_REDIRECT_PREFIX = os.getenv("AUDIO_ACCEL_REDIRECT_PREFIX")
+
 
 @router.get("/audio/{audio_id}")
 async def serve_audio(audio_id: str):
     file_path = f"uploads/{audio_id}.wav"
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail="Audio file not found.")
+    if AUDIO_ACCEL_REDIRECT_PREFIX:
+        return Response(media_type="audio/wav", headers={
+            "X-Accel-Redirect": f"{AUDIO_ACCEL_REDIRECT_PREFIX}/{audio_id}.wav"
+        })
     return FileResponse(file_path, media_type="audio/wav")
@@ -0,0 +1,48 @@
+from fastapi import APIRouter, HTTPException, Request
+from app.routes.segments import get_segments
+from app.routes.summary import build_audio_summary
+from app.utils.etag import json_response_with_etag
+import asyncio
+import logging
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+async def _part_or_none(coro, name: str, audio_id: str):
+    """Await one bundle part, mapping a 404 (not processed yet) to None."""
+    try:
+        return await coro
+    except HTTPException as e:
+        if e.status_code != 404:
+            raise
+        logger.info(f"Bundle part '{name}' not available for {audio_id}")
+        return None
+
+
+@router.get("/bundle/{audio_id}")
+async def get_audio_bundle(audio_id: str, request: Request):
+    """
+    Get everything the dashboard needs for one audio file in a single request.
+    Responses carry an ETag; a matching If-None-Match gets 304 with no body.
+
+    Returns:
+        {
+            "audio_id": "test1",
+            "segments": [...],   # same as /segments/{audio_id}["segments"], [] if missing
+            "summary": {...}     # same as /summary/{audio_id}, null if missing
+        }
+    """
+    segments_result, summary_result = await asyncio.gather(
+        _part_or_none(get_segments(audio_id), "segments", audio_id),
+        _part_or_none(build_audio_summary(audio_id), "summary", audio_id),
+    )
+
+    if segments_result is None and summary_result is None:
+        raise HTTPException(status_code=404, detail=f"Audio {audio_id} not found")
+
+    return json_response_with_etag(request, {
+        "audio_id": audio_id,
+        "segments": segments_result["segments"] if segments_result else [],
+        "summary": summary_result
+    })
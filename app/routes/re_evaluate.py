@@ -4,6 +4,7 @@ import importlib
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
 from rq import Queue
+from rq.job import Job
 from app.services.cache import redis_conn
 from app.config.personas import get_all_personas
 
@@ -87,6 +88,9 @@ async def re_evaluate_audio(audio_id: str, persona_ids: list[str] = None):
                 logger.error(f"Failed to queue {persona['display_name']} worker: {e}")
                 job_ids[persona_id] = f"error: {str(e)}"
         
+        # Remember job IDs so /re-evaluate-status/ can report progress
+        redis_conn.set(f"re_evaluate_jobs:{audio_id}", json.dumps(job_ids), ex=3600)
+        
         return JSONResponse({
             "audio_id": audio_id,
             "status": "re-evaluating",
@@ -103,3 +107,38 @@ async def re_evaluate_audio(audio_id: str, persona_ids: list[str] = None):
             status_code=500,
             detail=f"Internal server error: {str(e)}"
         )
+
+
+@router.get("/re-evaluate-status/{audio_id}")
+async def re_evaluate_status(audio_id: str):
+    """
+    Report progress of the most recent re-evaluation for an audio file.
+    
+    Returns:
+        - audio_id: Audio identifier
+        - status: "done" once every queued job has finished or failed,
+          "running" while any job is still pending, "unknown" if no
+          re-evaluation has been recorded
+        - jobs: Mapping of persona_id to RQ job status
+    """
+    job_ids_raw = redis_conn.get(f"re_evaluate_jobs:{audio_id}")
+    if not job_ids_raw:
+        return {"audio_id": audio_id, "status": "unknown", "jobs": {}}
+    
+    job_ids = json.loads(job_ids_raw)
+    queued = {pid: jid for pid, jid in job_ids.items() if not jid.startswith("error:")}
+    jobs = Job.fetch_many(list(queued.values()), connection=redis_conn)
+    
+    statuses = {}
+    for persona_id, job in zip(queued, jobs):
+        # Jobs whose results have expired are treated as finished
+        status = job.get_status() if job else "finished"
+        statuses[persona_id] = getattr(status, "value", status)
+    
+    done = all(status in ("finished", "failed", "stopped", "canceled") for status in statuses.values())
+    
+    return {
+        "audio_id": audio_id,
+        "status": "done" if done else "running",
+        "jobs": statuses
+    }
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from app.services.cache import redis_conn
 from app.services.summary_aggregator import aggregate_persona_feedback
 from app.config.personas import get_all_personas
+from app.utils.etag import json_response_with_etag
 import json
 import logging
 
@@ -10,9 +11,18 @@ logger = logging.getLogger(__name__)
 
 
 @router.get("/summary/{audio_id}")
-async def get_audio_summary(audio_id: str):
+async def get_audio_summary(audio_id: str, request: Request):
     """
-    Get aggregated summary statistics for all personas
+    Get aggregated summary statistics for all personas.
+    
+    Responses carry an ETag; a matching If-None-Match gets 304 with no body.
+    """
+    return json_response_with_etag(request, await build_audio_summary(audio_id))
+
+
+async def build_audio_summary(audio_id: str) -> dict:
+    """
+    Aggregate summary statistics for all personas (cached in Redis for 24 hours)
     
     Returns:
         {
@@ -1,3 +1,4 @@
+import heapq
 import json
 import logging
 from typing import List, Dict
@@ -40,13 +41,9 @@ def get_top_n_segments(scores: List[int], n: int = 3) -> List[int]:
     if not scores:
         return []
     
-    indexed_scores = [(idx, score) for idx, score in enumerate(scores)]
-    
-    sorted_scores = sorted(indexed_scores, key=lambda x: x[1], reverse=True)
-    
-    top_n = sorted_scores[:n]
-    
-    return [idx for idx, score in top_n]
+    # Partial selection (O(len * log n)) instead of a full sort; same stable order as
+    # sorted(..., reverse=True)[:n], so ties keep the earliest segment first
+    return heapq.nlargest(n, range(len(scores)), key=scores.__getitem__)
 
 
 def get_worst_n_segments(scores: List[int], n: int = 2) -> List[int]:
@@ -63,13 +60,7 @@ def get_worst_n_segments(scores: List[int], n: int = 2) -> List[int]:
     if not scores:
         return []
     
-    indexed_scores = [(idx, score) for idx, score in enumerate(scores)]
-    
-    sorted_scores = sorted(indexed_scores, key=lambda x: x[1])
-    
-    worst_n = sorted_scores[:n]
-    
-    return [idx for idx, score in worst_n]
+    return heapq.nsmallest(n, range(len(scores)), key=scores.__getitem__)
 
 
 def aggregate_persona_feedback(audio_id: str, persona_id: str, num_segments: int) -> Dict:
@@ -0,0 +1,21 @@
+import hashlib
+import json
+from fastapi import Request, Response
+
+
+def json_response_with_etag(request: Request, payload) -> Response:
+    """
+    Serialize payload as JSON with a content ETag.
+    
+    Returns 304 Not Modified (no body) when the client's If-None-Match
+    already names the current ETag, so unchanged data is neither sent nor re-parsed.
+    """
+    body = json.dumps(payload).encode()
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag in client_etags:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
@@ -1,21 +1,40 @@
-from dash import Dash, Input, Output, State, dcc, html, dash, ALL, callback_context, MATCH
+from dash import Dash, Input, Output, State, dcc, html, dash, ALL, callback_context, MATCH, ClientsideFunction, Patch
 from dash.exceptions import PreventUpdate
+import os
 import sys
 import json
+import importlib
+import hashlib
+import threading
+import traceback
+import requests
+from flask import Response, stream_with_context, send_file
+from collections import OrderedDict
 from pathlib import Path
-from components.waveform import render_waveform_with_highlight
+from components.waveform import render_waveform_with_highlight, waveform_shapes
 from components.audio_player import render_audio_player
 from components.metadata_panel import render_metadata_panel
 from components.admin_page import render_admin_page
 from components.summary_panel import render_collapsible_summary, render_detailed_summary
-from services.audio_utils import extract_waveform
-from services.api_client import fetch_segments
+from services.audio_utils import load_waveform, minmax_downsample
+from services.api_client import fetch_segments, fetch_bundle_async, prefetch_bundles, backend_session
 from utils.audio_scanner import get_all_audio_files
-from personas_config import get_all_personas
+from utils.playback import get_segment_starts, find_active_segment, clear_segment_starts
+import personas_config
+
+# orjson is optional; both paths emit 2-space indented, non-ASCII-escaped JSON
+try:
+    import orjson
+    
+    def dumps_json(obj, indent=False):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+except ImportError:
+    def dumps_json(obj, indent=False):
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
 
 # Import persona prompts from langflow_client for editing
 sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
-from services.langflow_client import PERSONA_PROMPTS
+from services.langflow_client import PERSONA_PROMPTS, PERSONA_PROMPTS_PATH
 
 # Get default audio_id from command line (for backwards compatibility)
 default_audio_id = sys.argv[1] if len(sys.argv) > 1 else None
@@ -28,12 +47,65 @@ else:
 
 # Initialize Dash app
 app = Dash(__name__, assets_folder='assets', suppress_callback_exceptions=True)
+server = app.server  # WSGI entrypoint, e.g. gunicorn -w 4 -k gthread --threads 8 app:server
+
+# Server-side waveform cache: audio_id -> (time, amplitude, amp_min, amp_max)
+# Only the audio_id and amplitude bounds travel through waveform-data-store, so
+# playback ticks never box/unbox the full sample arrays. Cached arrays are the
+# min/max envelope at roughly one point pair per pixel column.
+WAVEFORM_PLOT_BUCKETS = 2000
+_WAVEFORM_CACHE_SIZE = 8
+_WAVEFORM_CACHE = OrderedDict()
+_WAVEFORM_CACHE_LOCK = threading.Lock()
+
+
+def get_cached_waveform(audio_id):
+    """Return (time, amplitude, amp_min, amp_max) for audio_id, loading on a cache miss."""
+    with _WAVEFORM_CACHE_LOCK:
+        entry = _WAVEFORM_CACHE.get(audio_id)
+        if entry is not None:
+            _WAVEFORM_CACHE.move_to_end(audio_id)
+            return entry
+    
+    time, amplitude = load_waveform(f"uploads/{audio_id}.wav")
+    amp_min, amp_max = float(amplitude.min()), float(amplitude.max())
+    time, amplitude = minmax_downsample(time, amplitude, WAVEFORM_PLOT_BUCKETS)
+    entry = (time, amplitude, amp_min, amp_max)
+    
+    with _WAVEFORM_CACHE_LOCK:
+        _WAVEFORM_CACHE[audio_id] = entry
+        _WAVEFORM_CACHE.move_to_end(audio_id)
+        if len(_WAVEFORM_CACHE) > _WAVEFORM_CACHE_SIZE:
+            _WAVEFORM_CACHE.popitem(last=False)
+    
+    return entry
+
+
+# Re-evaluation status polling (reeval-poll interval)
+REEVAL_POLL_INTERVAL_MS = 1500
+REEVAL_MAX_POLLS = 20
+
+# The playback clientside callback only writes current-time-store when the playhead
+# crosses into a new bucket of this size (1/4 s)
+CURSOR_BUCKETS_PER_SECOND = 4
+
 
 # Add audio proxy endpoint to serve audio through port 5000
+# Local uploads are handed to nginx (X-Accel-Redirect, when AUDIO_ACCEL_REDIRECT_PREFIX
+# is set) or sent with send_file, which answers Range requests for seeking; only files
+# missing locally are streamed through from the backend
+AUDIO_ACCEL_REDIRECT_PREFIX = os.getenv("AUDIO_ACCEL_REDIRECT_PREFIX")
+
+
 @app.server.route('/audio/<audio_id>')
 def proxy_audio(audio_id):
-    import requests
-    from flask import Response, stream_with_context
+    audio_path = Path("uploads") / f"{audio_id}.wav"
+    if audio_path.is_file():
+        if AUDIO_ACCEL_REDIRECT_PREFIX:
+            return Response(content_type='audio/wav', headers={
+                'X-Accel-Redirect': f"{AUDIO_ACCEL_REDIRECT_PREFIX}/{audio_id}.wav"
+            })
+        return send_file(audio_path.resolve(), mimetype='audio/wav', conditional=True)
     
     # Fetch audio from backend
     backend_url = f"http://localhost:8000/audio/{audio_id}"
@@ -64,10 +136,117 @@ def get_score_color(score):
         return "#ef4444"  # Red - Low
 
 
+def atomic_write_text(path, content):
+    """Write content to path via a temp file + rename so readers never see a partial file."""
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def save_persona_prompt(chain_name, prompt):
+    """Persist one chain's prompt to persona_prompts.json and refresh the in-memory copy."""
+    with open(PERSONA_PROMPTS_PATH, encoding="utf-8") as f:
+        prompts = json.load(f)
+    prompts[chain_name] = prompt
+    atomic_write_text(PERSONA_PROMPTS_PATH, dumps_json(prompts, indent=True) + "\n")
+    PERSONA_PROMPTS[chain_name] = prompt
+
+
+# personas_config.py is rewritten by the admin callbacks; reload it only when its mtime
+# changes or an edit bumps the version. The version doubles as a cache-invalidation token.
+# The lock keeps concurrent callbacks from reloading the module at the same time.
+_PERSONAS_CONFIG_PATH = Path(personas_config.__file__)
+_personas_cache = {'mtime': None, 'data': None, 'version': 0}
+_PERSONAS_CACHE_LOCK = threading.Lock()
+
+
+def get_all_personas_cached():
+    """Return the persona list, reloading personas_config.py only if it changed on disk."""
+    mtime = _PERSONAS_CONFIG_PATH.stat().st_mtime_ns
+    with _PERSONAS_CACHE_LOCK:
+        if mtime != _personas_cache['mtime']:
+            if _personas_cache['data'] is not None:
+                importlib.reload(personas_config)
+            _personas_cache['mtime'] = mtime
+            _personas_cache['data'] = personas_config.get_all_personas()
+            _personas_cache['version'] += 1
+        return _personas_cache['data']
+
+
+def bump_personas_version():
+    """Force a reload (and new version) on next access, after personas are created/edited."""
+    with _PERSONAS_CACHE_LOCK:
+        _personas_cache['mtime'] = None
+
+
+def personas_version():
+    """Current personas version token; changes whenever the persona list is reloaded."""
+    get_all_personas_cached()
+    return _personas_cache['version']
+
+
+# Rendered summary trees keyed by (kind, collapsed, personas version, summary digest).
+# The summary digest stands in for audio_id so re-evaluated results never hit
+# a stale entry; persona edits invalidate through the version token.
+_SUMMARY_PANEL_CACHE_SIZE = 64
+_SUMMARY_PANEL_CACHE = OrderedDict()
+_SUMMARY_PANEL_CACHE_LOCK = threading.Lock()
+
+
+def summary_digest(summary_data):
+    """Stable digest of summary data (same across processes, unlike hash())."""
+    return hashlib.blake2b(dumps_json(summary_data).encode(), digest_size=16).hexdigest()
+
+
+def get_cached_summary_panel(kind, summary_data, is_collapsed=False):
+    """Return the rendered summary component tree ('collapsible' or 'detailed'), rendering on a miss."""
+    key = (kind, bool(is_collapsed), personas_version(), summary_digest(summary_data))
+    with _SUMMARY_PANEL_CACHE_LOCK:
+        tree = _SUMMARY_PANEL_CACHE.get(key)
+        if tree is not None:
+            _SUMMARY_PANEL_CACHE.move_to_end(key)
+            return tree
+    
+    personas = get_all_personas_cached()
+    if kind == 'collapsible':
+        tree = render_collapsible_summary(personas, summary_data, is_expanded=not is_collapsed)
+    else:
+        tree = render_detailed_summary(personas, summary_data)
+    
+    with _SUMMARY_PANEL_CACHE_LOCK:
+        _SUMMARY_PANEL_CACHE[key] = tree
+        _SUMMARY_PANEL_CACHE.move_to_end(key)
+        if len(_SUMMARY_PANEL_CACHE) > _SUMMARY_PANEL_CACHE_SIZE:
+            _SUMMARY_PANEL_CACHE.popitem(last=False)
+    
+    return tree
+
+
+# Sidebar files whose segments/summary bundles are warmed in the background. The
+# warm-up runs once, on the first file load, not when the layout is built at import,
+# so starting a worker (or importing app in tests) fires no /bundle requests.
+_pending_prefetch_ids = []
+_PREFETCH_LOCK = threading.Lock()
+
+
+def prefetch_sidebar_bundles(loaded_audio_id=None):
+    """Warm the bundle cache for the sidebar files once per process, skipping the loaded one."""
+    with _PREFETCH_LOCK:
+        audio_ids = [audio_id for audio_id in _pending_prefetch_ids if audio_id != loaded_audio_id]
+        _pending_prefetch_ids.clear()
+    if audio_ids:
+        prefetch_bundles(audio_ids)
+
+
 def create_file_sidebar():
     """Create the left sidebar with clickable file browser."""
     audio_files = get_all_audio_files()  # Already includes summary data
-    personas = get_all_personas()
+    personas = get_all_personas_cached()
+    
+    # Queue the listed files for prefetch_sidebar_bundles (newest first)
+    with _PREFETCH_LOCK:
+        _pending_prefetch_ids[:] = [audio["audio_id"] for audio in audio_files]
     
     if not audio_files:
         file_list = html.Div(
@@ -82,7 +261,7 @@ def create_file_sidebar():
     else:
         # Create clickable file items - each outputs to the same hidden store
         file_items = []
-        for i, audio in enumerate(audio_files):
+        for audio in audio_files:
             short_id = audio["audio_id"][:12] + "..."
             is_selected = audio["audio_id"] == default_audio_id
             
@@ -137,9 +316,8 @@ def create_file_sidebar():
                     "textAlign": "left"
                 })
             ], 
-            id=f"file-btn-{i}",
+            id={'type': 'file-btn', 'index': audio["audio_id"]},  # Pattern-matching id carries the audio_id
             n_clicks=0,
-            **{"data-audio-id": audio["audio_id"]},  # Store audio_id in data attribute
             style={
                 "display": "flex",
                 "alignItems": "flex-start",
@@ -367,14 +545,18 @@ app.layout = html.Div([
         
         # Hidden components for state management
         dcc.Interval(id="playback-sync", interval=1000, n_intervals=0),  # Update every second
+        dcc.Interval(id="reeval-poll", interval=REEVAL_POLL_INTERVAL_MS, n_intervals=0, disabled=True),  # Re-evaluation status poller
         dcc.Store(id="user-clicked", data=False),
         dcc.Store(id='current-time-store', data=0),
+        dcc.Store(id='metadata-segment-store', data=None),  # [start, end] of the segment in the metadata panel ([] = none, None = not rendered yet)
         dcc.Store(id='current-audio-id', data=default_audio_id),
         dcc.Store(id='segments-store', data=[]),
-        dcc.Store(id='waveform-data-store', data={'time': [], 'amplitude': []}),
+        dcc.Store(id='waveform-data-store', data={'audio_id': None}),
         dcc.Store(id='waveform-click-dummy', data=None),  # Dummy store for clientside callback
         dcc.Store(id='summary-data-store', data=None),  # Store for summary data (Phase 3)
         dcc.Store(id='summary-collapsed', data=False),  # Store for collapse state
+        dcc.Store(id='summary-panel-hash', data=None),  # Digest of the summary last rendered in the panel
+        dcc.Store(id='summary-tab-hash', data=None),  # Digest of the summary last rendered in the tab
     ], style={
         "marginLeft": "280px",  # Offset for fixed sidebar
         "minHeight": "100vh"
@@ -445,18 +627,92 @@ def toggle_admin_modal(open_clicks, close_clicks):
         return {"display": "none"}
 
 
+# Persona card styles, shared by every card instead of rebuilt per persona per render
+_CARD_STYLE = {
+    "padding": "16px",
+    "backgroundColor": "#f9fafb",
+    "border": "1px solid #e5e7eb",
+    "borderRadius": "6px",
+    "marginBottom": "12px"
+}
+_CARD_HEADER_STYLE = {"display": "flex", "alignItems": "flex-start", "marginBottom": "12px"}
+_CARD_EMOJI_STYLE = {"fontSize": "24px", "marginRight": "12px"}
+_CARD_TEXT_STYLE = {"flex": "1"}
+_CARD_NAME_STYLE = {"fontSize": "16px", "color": "#111827", "display": "block"}
+_CARD_ID_STYLE = {"fontSize": "12px", "color": "#6b7280", "display": "block", "marginTop": "2px"}
+_CARD_DESCRIPTION_STYLE = {"fontSize": "13px", "color": "#6b7280", "display": "block", "marginTop": "4px"}
+_EDIT_BUTTON_STYLE = {
+    "width": "100%",
+    "padding": "8px",
+    "backgroundColor": "#ffffff",
+    "color": "#3b82f6",
+    "border": "1px solid #3b82f6",
+    "borderRadius": "4px",
+    "cursor": "pointer",
+    "fontSize": "13px",
+    "fontWeight": "500"
+}
+
+_EDIT_CARD_STYLE = {
+    "padding": "16px",
+    "backgroundColor": "#eff6ff",
+    "border": "2px solid #3b82f6",
+    "borderRadius": "6px",
+    "marginBottom": "12px"
+}
+_EDIT_HEADER_STYLE = {
+    "display": "flex",
+    "alignItems": "center",
+    "marginBottom": "16px",
+    "paddingBottom": "12px",
+    "borderBottom": "2px solid #e5e7eb"
+}
+_EDIT_TITLE_STYLE = {"fontSize": "16px", "color": "#3b82f6"}
+_EDIT_LABEL_STYLE = {"fontWeight": "500", "fontSize": "13px", "marginBottom": "4px", "display": "block"}
+_EDIT_INPUT_STYLE = {
+    "width": "100%",
+    "padding": "8px",
+    "marginBottom": "12px",
+    "border": "1px solid #d1d5db",
+    "borderRadius": "4px",
+    "boxSizing": "border-box"
+}
+_EDIT_PROMPT_STYLE = {
+    **_EDIT_INPUT_STYLE,
+    "height": "120px",
+    "fontFamily": "monospace",
+    "fontSize": "12px",
+    "resize": "vertical"
+}
+_EDIT_PROMPT_LAST_STYLE = {**_EDIT_PROMPT_STYLE, "marginBottom": "16px"}
+_SAVE_BUTTON_STYLE = {"padding": "10px 16px", "backgroundColor": "#3b82f6", "color": "white", "border": "none", "borderRadius": "4px", "cursor": "pointer", "marginRight": "8px", "fontWeight": "500"}
+_CANCEL_BUTTON_STYLE = {"padding": "10px 16px", "backgroundColor": "#6b7280", "color": "white", "border": "none", "borderRadius": "4px", "cursor": "pointer", "fontWeight": "500"}
+
+# Persona list pagination (admin panel)
+PERSONAS_PAGE_SIZE = 20
+_PAGER_STYLE = {"display": "flex", "alignItems": "center", "justifyContent": "space-between", "marginTop": "12px"}
+_PAGER_HIDDEN_STYLE = {"display": "none"}
+
+
 # Callback 6: Render and update persona cards with edit capability
+# Only the current page of cards is built, so render cost stays flat as personas grow
 @app.callback(
     Output('personas-list', 'children'),
+    Output('personas-page-label', 'children'),
+    Output('personas-pager', 'style'),
     Input('editing-persona-id', 'data'),
+    Input('personas-page', 'data'),
     prevent_initial_call=False  # Render on initial load
 )
-def render_persona_cards(editing_id):
-    """Render persona cards, expanding the one being edited."""
-    personas = get_all_personas()
+def render_persona_cards(editing_id, page):
+    """Render the current page of persona cards, expanding the one being edited."""
+    personas = get_all_personas_cached()
+    num_pages = max(1, -(-len(personas) // PERSONAS_PAGE_SIZE))
+    page = min(max(page or 0, 0), num_pages - 1)
+    page_personas = personas[page * PERSONAS_PAGE_SIZE:(page + 1) * PERSONAS_PAGE_SIZE]
     cards = []
     
-    for persona in personas:
+    for persona in page_personas:
         persona_id = persona['id']
         is_editing = (editing_id == persona_id)
         
@@ -465,7 +721,7 @@ def render_persona_cards(editing_id):
         
         if is_editing:
             # EXPANDED: Show edit form
-            # Load current prompts from langflow_client.py
+            # Load current prompts from persona_prompts.json
             current_prompts = PERSONA_PROMPTS.get(chain_name, {
                 "system": "",
                 "user_template": ""
@@ -474,106 +730,51 @@ def render_persona_cards(editing_id):
             card = html.Div([
                 # Header with persona info
                 html.Div([
-                    html.Span(persona['emoji'], style={
-                        "fontSize": "24px",
-                        "marginRight": "12px"
-                    }),
-                    html.Strong(f"Editing: {persona['display_name']}", style={
-                        "fontSize": "16px",
-                        "color": "#3b82f6"
-                    })
-                ], style={
-                    "display": "flex",
-                    "alignItems": "center",
-                    "marginBottom": "16px",
-                    "paddingBottom": "12px",
-                    "borderBottom": "2px solid #e5e7eb"
-                }),
+                    html.Span(persona['emoji'], style=_CARD_EMOJI_STYLE),
+                    html.Strong(f"Editing: {persona['display_name']}", style=_EDIT_TITLE_STYLE)
+                ], style=_EDIT_HEADER_STYLE),
                 
                 # Edit form fields
                 html.Div([
                     # Display Name
-                    html.Label("Display Name:", style={"fontWeight": "500", "fontSize": "13px", "marginBottom": "4px", "display": "block"}),
+                    html.Label("Display Name:", style=_EDIT_LABEL_STYLE),
                     dcc.Input(
                         id={'type': 'edit-name', 'id': persona_id},
                         value=persona['display_name'],
-                        style={
-                            "width": "100%",
-                            "padding": "8px",
-                            "marginBottom": "12px",
-                            "border": "1px solid #d1d5db",
-                            "borderRadius": "4px",
-                            "boxSizing": "border-box"
-                        }
+                        style=_EDIT_INPUT_STYLE
                     ),
                     
                     # Emoji
-                    html.Label("Emoji:", style={"fontWeight": "500", "fontSize": "13px", "marginBottom": "4px", "display": "block"}),
+                    html.Label("Emoji:", style=_EDIT_LABEL_STYLE),
                     dcc.Input(
                         id={'type': 'edit-emoji', 'id': persona_id},
                         value=persona['emoji'],
                         maxLength=2,
-                        style={
-                            "width": "100%",
-                            "padding": "8px",
-                            "marginBottom": "12px",
-                            "border": "1px solid #d1d5db",
-                            "borderRadius": "4px",
-                            "boxSizing": "border-box"
-                        }
+                        style=_EDIT_INPUT_STYLE
                     ),
                     
                     # Description
-                    html.Label("Description:", style={"fontWeight": "500", "fontSize": "13px", "marginBottom": "4px", "display": "block"}),
+                    html.Label("Description:", style=_EDIT_LABEL_STYLE),
                     dcc.Input(
                         id={'type': 'edit-description', 'id': persona_id},
                         value=persona.get('description', ''),
-                        style={
-                            "width": "100%",
-                            "padding": "8px",
-                            "marginBottom": "12px",
-                            "border": "1px solid #d1d5db",
-                            "borderRadius": "4px",
-                            "boxSizing": "border-box"
-                        }
+                        style=_EDIT_INPUT_STYLE
                     ),
                     
                     # System Prompt
-                    html.Label("System Prompt:", style={"fontWeight": "500", "fontSize": "13px", "marginBottom": "4px", "display": "block"}),
+                    html.Label("System Prompt:", style=_EDIT_LABEL_STYLE),
                     dcc.Textarea(
                         id={'type': 'edit-system-prompt', 'id': persona_id},
                         value=current_prompts.get('system', ''),
-                        style={
-                            "width": "100%",
-                            "height": "120px",
-                            "padding": "8px",
-                            "marginBottom": "12px",
-                            "border": "1px solid #d1d5db",
-                            "borderRadius": "4px",
-                            "fontFamily": "monospace",
-                            "fontSize": "12px",
-                            "boxSizing": "border-box",
-                            "resize": "vertical"
-                        }
+                        style=_EDIT_PROMPT_STYLE
                     ),
                     
                     # User Template Prompt
-                    html.Label("User Template:", style={"fontWeight": "500", "fontSize": "13px", "marginBottom": "4px", "display": "block"}),
+                    html.Label("User Template:", style=_EDIT_LABEL_STYLE),
                     dcc.Textarea(
                         id={'type': 'edit-user-template', 'id': persona_id},
                         value=current_prompts.get('user_template', ''),
-                        style={
-                            "width": "100%",
-                            "height": "120px",
-                            "padding": "8px",
-                            "marginBottom": "16px",
-                            "border": "1px solid #d1d5db",
-                            "borderRadius": "4px",
-                            "fontFamily": "monospace",
-                            "fontSize": "12px",
-                            "boxSizing": "border-box",
-                            "resize": "vertical"
-                        }
+                        style=_EDIT_PROMPT_LAST_STYLE
                     ),
                     
                     # Action buttons
@@ -582,86 +783,64 @@ def render_persona_cards(editing_id):
                             "💾 Save Changes",
                             id={'type': 'save-persona-btn', 'id': persona_id},
                             n_clicks=0,
-                            style={"padding": "10px 16px", "backgroundColor": "#3b82f6", "color": "white", "border": "none", "borderRadius": "4px", "cursor": "pointer", "marginRight": "8px", "fontWeight": "500"}
+                            style=_SAVE_BUTTON_STYLE
                         ),
                         html.Button(
                             "✕ Cancel",
                             id={'type': 'cancel-edit-btn', 'id': persona_id},
                             n_clicks=0,
-                            style={"padding": "10px 16px", "backgroundColor": "#6b7280", "color": "white", "border": "none", "borderRadius": "4px", "cursor": "pointer", "fontWeight": "500"}
+                            style=_CANCEL_BUTTON_STYLE
                         )
                     ])
                 ])
-            ], style={
-                "padding": "16px",
-                "backgroundColor": "#eff6ff",
-                "border": "2px solid #3b82f6",
-                "borderRadius": "6px",
-                "marginBottom": "12px"
-            })
+            ], style=_EDIT_CARD_STYLE)
         else:
             # COLLAPSED: Show compact view with Edit button
             card = html.Div([
                 html.Div([
                     html.Div([
-                        html.Span(persona['emoji'], style={
-                            "fontSize": "24px",
-                            "marginRight": "12px"
-                        }),
+                        html.Span(persona['emoji'], style=_CARD_EMOJI_STYLE),
                         html.Div([
-                            html.Strong(persona['display_name'], style={
-                                "fontSize": "16px",
-                                "color": "#111827",
-                                "display": "block"
-                            }),
-                            html.Span(f"ID: {persona_id}", style={
-                                "fontSize": "12px",
-                                "color": "#6b7280",
-                                "display": "block",
-                                "marginTop": "2px"
-                            }),
-                            html.Span(persona.get('description', ''), style={
-                                "fontSize": "13px",
-                                "color": "#6b7280",
-                                "display": "block",
-                                "marginTop": "4px"
-                            })
-                        ], style={"flex": "1"})
-                    ], style={
-                        "display": "flex",
-                        "alignItems": "flex-start",
-                        "marginBottom": "12px"
-                    }),
+                            html.Strong(persona['display_name'], style=_CARD_NAME_STYLE),
+                            html.Span(f"ID: {persona_id}", style=_CARD_ID_STYLE),
+                            html.Span(persona.get('description', ''), style=_CARD_DESCRIPTION_STYLE)
+                        ], style=_CARD_TEXT_STYLE)
+                    ], style=_CARD_HEADER_STYLE),
                     
                     # Edit button
                     html.Button(
                         "✏️ Edit",
                         id={'type': 'edit-persona-btn', 'id': persona_id},
                         n_clicks=0,
-                        style={
-                            "width": "100%",
-                            "padding": "8px",
-                            "backgroundColor": "#ffffff",
-                            "color": "#3b82f6",
-                            "border": "1px solid #3b82f6",
-                            "borderRadius": "4px",
-                            "cursor": "pointer",
-                            "fontSize": "13px",
-                            "fontWeight": "500"
-                        }
+                        style=_EDIT_BUTTON_STYLE
                     )
                 ])
-            ], style={
-                "padding": "16px",
-                "backgroundColor": "#f9fafb",
-                "border": "1px solid #e5e7eb",
-                "borderRadius": "6px",
-                "marginBottom": "12px"
-            })
+            ], style=_CARD_STYLE)
         
         cards.append(card)
     
-    return cards
+    pager_style = _PAGER_STYLE if num_pages > 1 else _PAGER_HIDDEN_STYLE
+    return cards, f"Page {page + 1} of {num_pages}", pager_style
+
+
+# Callback 6a: Step through persona pages
+@app.callback(
+    Output('personas-page', 'data'),
+    Input('personas-prev-page', 'n_clicks'),
+    Input('personas-next-page', 'n_clicks'),
+    State('personas-page', 'data'),
+    prevent_initial_call=True
+)
+def change_personas_page(prev_clicks, next_clicks, page):
+    """Move to the previous/next page of persona cards, clamped to the valid range."""
+    num_pages = max(1, -(-len(get_all_personas_cached()) // PERSONAS_PAGE_SIZE))
+    ctx = callback_context
+    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
+    step = -1 if button_id == 'personas-prev-page' else 1
+    new_page = min(max((page or 0) + step, 0), num_pages - 1)
+    if new_page == page:
+        raise PreventUpdate
+    return new_page
 
 
 # Callback 7: Handle Edit button clicks to expand persona card
@@ -682,9 +861,8 @@ def handle_edit_buttons(edit_clicks, cancel_clicks):
     # Extract the button type and persona ID from the triggered component
     if 'edit-persona-btn' in triggered_id:
         # Parse the ID from the pattern-matching callback
-        import json as json_module
         id_str = triggered_id.split('.')[0]
-        id_dict = json_module.loads(id_str)
+        id_dict = json.loads(id_str)
         persona_id = id_dict['id']
         print(f"[EDIT] Opening edit mode for persona: {persona_id}")
         return persona_id
@@ -723,14 +901,13 @@ def save_persona_changes(save_clicks, names, emojis, descriptions, system_prompt
         raise PreventUpdate
     
     # Parse which persona was saved
-    import json as json_module
     id_str = triggered_id.split('.')[0]
-    id_dict = json_module.loads(id_str)
+    id_dict = json.loads(id_str)
     persona_id = id_dict['id']
     
     # Find the index of this persona in the ALL arrays
     # The index corresponds to the order personas appear in the cards
-    personas = get_all_personas()
+    personas = get_all_personas_cached()
     persona_index = next((i for i, p in enumerate(personas) if p['id'] == persona_id), None)
     
     if persona_index is None:
@@ -775,23 +952,14 @@ def save_persona_changes(save_clicks, names, emojis, descriptions, system_prompt
         personas_config_path = Path(__file__).parent / "personas_config.py"
         personas_content = personas_config_path.read_text()
         
-        # Find and update this persona in the PERSONAS list
-        # We'll do a simple find-replace approach
-        personas_list = get_all_personas()
-        new_personas_list = []
-        
-        for p in personas_list:
-            if p['id'] == persona_id:
-                # Update this persona
-                new_personas_list.append({
-                    "id": persona_id,
-                    "display_name": new_name,
-                    "emoji": new_emoji,
-                    "description": new_description
-                })
-            else:
-                # Keep as is
-                new_personas_list.append(p)
+        # Replace just this persona in a shallow copy (the cached list is shared)
+        new_personas_list = list(personas)
+        new_personas_list[persona_index] = {
+            "id": persona_id,
+            "display_name": new_name,
+            "emoji": new_emoji,
+            "description": new_description
+        }
         
         # Rewrite the personas_config.py file
         new_config_content = f'''"""
@@ -799,74 +967,22 @@ Persona configuration for dashboard.
 This mirrors the configuration in app/config/personas.py
 """
 
-PERSONAS = {json.dumps(new_personas_list, indent=4)}
+PERSONAS = {dumps_json(new_personas_list, indent=True)}
 
 def get_all_personas():
     """Get all persona configurations"""
     return PERSONAS
 '''
         personas_config_path.write_text(new_config_content)
+        bump_personas_version()
         print(f"[SAVE] Updated personas_config.py")
         
-        # Update langflow_client.py
-        langflow_path = Path(__file__).parent.parent / "app" / "services" / "langflow_client.py"
-        langflow_content = langflow_path.read_text()
-        
-        # Update the PERSONA_PROMPTS dictionary for this chain
-        chain_name = f"{persona_id}_chain"
-        
-        # Read current PERSONA_PROMPTS
-        import re
-        
-        # Find the chain in the file and replace it
-        pattern = rf'"{chain_name}":\s*{{[^}}]*"system":\s*"[^"]*"[^}}]*"user_template":\s*"""[^"""]*"""[^}}]*}}'
-        
-        # Create the new chain content
-        new_chain = f'''"{chain_name}": {{
-        "system": {json.dumps(new_system_prompt)},
-        "user_template": {json.dumps(new_user_template)}
-    }}'''
-        
-        # Try to replace using regex (but catch errors if replacement string has escape sequences)
-        try:
-            new_langflow_content = re.sub(pattern, new_chain, langflow_content, flags=re.DOTALL)
-        except re.error:
-            # Regex failed (likely due to escape sequences in replacement string)
-            new_langflow_content = langflow_content
-        
-        # If regex didn't match or failed, use manual approach
-        if new_langflow_content == langflow_content:
-            # Manual replacement - find the chain and replace it
-            # This is more robust for multi-line strings
-            start_marker = f'"{chain_name}":'
-            if start_marker in langflow_content:
-                # Find start and end of this chain
-                start_idx = langflow_content.find(start_marker)
-                # Find the next chain or closing brace
-                rest = langflow_content[start_idx:]
-                # Count braces to find the end
-                brace_count = 0
-                end_idx = start_idx
-                in_chain = False
-                for i, char in enumerate(rest):
-                    if char == '{':
-                        brace_count += 1
-                        in_chain = True
-                    elif char == '}':
-                        brace_count -= 1
-                        if in_chain and brace_count == 0:
-                            end_idx = start_idx + i + 1
-                            break
-                
-                # Replace this section
-                new_langflow_content = (
-                    langflow_content[:start_idx] +
-                    new_chain +
-                    langflow_content[end_idx:]
-                )
-        
-        langflow_path.write_text(new_langflow_content)
-        print(f"[SAVE] Updated langflow_client.py")
+        # Update persona_prompts.json (and the in-memory prompts used by the edit form)
+        save_persona_prompt(f"{persona_id}_chain", {
+            "system": new_system_prompt,
+            "user_template": new_user_template
+        })
+        print(f"[SAVE] Updated persona_prompts.json")
         
         # Success! Close the edit mode and show success message with re-evaluate button
         print(f"[SAVE] ✅ Successfully saved persona: {persona_id}")
@@ -906,7 +1022,6 @@ def get_all_personas():
         
     except Exception as e:
         print(f"[SAVE] ❌ Error saving persona: {str(e)}")
-        import traceback
         traceback.print_exc()
         error_toast = html.Div(f"❌ Error: {str(e)}", style={
             "position": "fixed",
@@ -926,65 +1041,47 @@ def get_all_personas():
 
 
 # Callback 9: Handle re-evaluation button click
+# Fire-and-forget: queue the re-evaluation and hand off to the reeval-poll interval
+# so no callback worker is held while personas are re-scored.
 @app.callback(
     Output('save-toast', 'children', allow_duplicate=True),
     Output('save-toast', 'style', allow_duplicate=True),
-    Output('segments-store', 'data', allow_duplicate=True),
+    Output('reeval-poll', 'disabled'),
+    Output('reeval-poll', 'n_intervals'),
     Input('re-evaluate-btn', 'n_clicks'),
     State('current-audio-id', 'data'),
     prevent_initial_call=True
 )
 def trigger_re_evaluation(n_clicks, audio_id):
     """Trigger re-evaluation of current audio file with all personas."""
-    import requests
-    import time
-    
     if not n_clicks or not audio_id:
         raise PreventUpdate
     
     print(f"[RE-EVAL] Triggering re-evaluation for audio: {audio_id}")
     
     try:
-        # Show loading toast
-        loading_toast = html.Div("🔄 Re-evaluating audio with updated persona settings...", style={
-            "position": "fixed",
-            "top": "20px",
-            "right": "20px",
-            "backgroundColor": "#3b82f6",
-            "color": "white",
-            "padding": "12px 20px",
-            "borderRadius": "6px",
-            "fontSize": "14px",
-            "fontWeight": "500",
-            "boxShadow": "0 4px 6px rgba(0,0,0,0.1)",
-            "zIndex": "10000",
-            "display": "block"
-        })
-        
         # Call backend re-evaluation endpoint
-        response = requests.post(f"http://localhost:8000/re-evaluate/{audio_id}")
+        response = backend_session.post(f"http://localhost:8000/re-evaluate/{audio_id}", timeout=5)
         response.raise_for_status()
         
         result = response.json()
         print(f"[RE-EVAL] API Response: {result.get('message')}")
         print(f"[RE-EVAL] Queued {result.get('personas_queued')} persona(s)")
         
-        # Wait a few seconds for processing (simple polling approach)
-        time.sleep(8)
-        
-        # Fetch updated segments
-        segments_response = requests.get(f"http://localhost:8000/segments/{audio_id}")
-        segments_response.raise_for_status()
-        updated_segments = segments_response.json()
+    except requests.exceptions.ReadTimeout:
+        # The request reached the backend, which may still be queuing personas; the
+        # poller reports the outcome (and gives up after REEVAL_MAX_POLLS)
+        print("[RE-EVAL] No response yet, polling for status")
         
-        print(f"[RE-EVAL] ✅ Re-evaluation complete, loaded {len(updated_segments)} segments")
+    except Exception as e:
+        print(f"[RE-EVAL] ❌ Error during re-evaluation: {str(e)}")
+        traceback.print_exc()
         
-        # Show success toast
-        success_toast = html.Div("✅ Re-evaluation complete! Dashboard updated with new results.", style={
+        error_toast = html.Div(f"❌ Re-evaluation failed: {str(e)}", style={
             "position": "fixed",
             "top": "20px",
             "right": "20px",
-            "backgroundColor": "#10b981",
+            "backgroundColor": "#ef4444",
             "color": "white",
             "padding": "12px 20px",
             "borderRadius": "6px",
@@ -994,19 +1091,63 @@ def trigger_re_evaluation(n_clicks, audio_id):
             "zIndex": "10000",
             "display": "block"
         })
-        
-        return success_toast, {"display": "block"}, updated_segments
-        
+        return error_toast, {"display": "block"}, True, 0
+    
+    # Show loading toast until the poller reports completion
+    loading_toast = html.Div("🔄 Re-evaluating audio with updated persona settings...", style={
+        "position": "fixed",
+        "top": "20px",
+        "right": "20px",
+        "backgroundColor": "#3b82f6",
+        "color": "white",
+        "padding": "12px 20px",
+        "borderRadius": "6px",
+        "fontSize": "14px",
+        "fontWeight": "500",
+        "boxShadow": "0 4px 6px rgba(0,0,0,0.1)",
+        "zIndex": "10000",
+        "display": "block"
+    })
+    
+    return loading_toast, {"display": "block"}, False, 0
+
+
+# Callback 9b: Poll re-evaluation progress and load updated segments when done
+@app.callback(
+    Output('save-toast', 'children', allow_duplicate=True),
+    Output('save-toast', 'style', allow_duplicate=True),
+    Output('segments-store', 'data', allow_duplicate=True),
+    Output('reeval-poll', 'disabled', allow_duplicate=True),
+    Output('segment-metadata', 'children', allow_duplicate=True),
+    Output('metadata-segment-store', 'data', allow_duplicate=True),
+    Input('reeval-poll', 'n_intervals'),
+    State('current-audio-id', 'data'),
+    State('current-time-store', 'data'),
+    prevent_initial_call=True
+)
+def poll_re_evaluation(n_intervals, audio_id, current_time):
+    """Check re-evaluation status; stop polling once the backend reports done."""
+    if not n_intervals or not audio_id:
+        raise PreventUpdate
+    
+    try:
+        status_response = backend_session.get(f"http://localhost:8000/re-evaluate-status/{audio_id}", timeout=2)
+        status_response.raise_for_status()
+        status = status_response.json().get("status")
     except Exception as e:
-        print(f"[RE-EVAL] ❌ Error during re-evaluation: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        print(f"[RE-EVAL] Status check failed: {str(e)}")
+        status = None
+    
+    if status != "done":
+        if n_intervals < REEVAL_MAX_POLLS:
+            raise PreventUpdate
         
-        error_toast = html.Div(f"❌ Re-evaluation failed: {str(e)}", style={
+        print(f"[RE-EVAL] ❌ Gave up waiting after {n_intervals} polls")
+        timeout_toast = html.Div("⏱️ Re-evaluation is taking longer than expected. Reload the file to see new results.", style={
             "position": "fixed",
             "top": "20px",
             "right": "20px",
-            "backgroundColor": "#ef4444",
+            "backgroundColor": "#f59e0b",
             "color": "white",
             "padding": "12px 20px",
             "borderRadius": "6px",
@@ -1016,36 +1157,66 @@ def trigger_re_evaluation(n_clicks, audio_id):
             "zIndex": "10000",
             "display": "block"
         })
-        return error_toast, {"display": "block"}, dash.no_update
+        return timeout_toast, {"display": "block"}, dash.no_update, True, dash.no_update, dash.no_update
+    
+    # Fetch updated segments
+    updated_segments = fetch_segments(audio_id)
+    print(f"[RE-EVAL] ✅ Re-evaluation complete, loaded {len(updated_segments)} segments")
+    
+    # Rebuild the segment lookup and re-render the metadata panel from the new results
+    # now, rather than waiting for playback to enter another segment (or to resume)
+    clear_segment_starts(audio_id)
+    seg_starts = get_segment_starts(audio_id, updated_segments)
+    active_segment = find_active_segment(updated_segments, seg_starts, current_time or 0)
+    if active_segment:
+        metadata = render_metadata_panel(active_segment)
+        shown_segment = [active_segment['start'], active_segment['end']]
+    else:
+        metadata = html.Div(
+            "No segment at this time position.",
+            style={"padding": "20px", "color": "#6b7280"}
+        )
+        shown_segment = []
+    
+    # Show success toast
+    success_toast = html.Div("✅ Re-evaluation complete! Dashboard updated with new results.", style={
+        "position": "fixed",
+        "top": "20px",
+        "right": "20px",
+        "backgroundColor": "#10b981",
+        "color": "white",
+        "padding": "12px 20px",
+        "borderRadius": "6px",
+        "fontSize": "14px",
+        "fontWeight": "500",
+        "boxShadow": "0 4px 6px rgba(0,0,0,0.1)",
+        "zIndex": "10000",
+        "display": "block"
+    })
+    
+    return success_toast, {"display": "block"}, updated_segments, True, metadata, shown_segment
 
 
 # Callback 1b: Update selected audio store when file button clicked
-# Generate inputs dynamically based on actual number of files
-audio_files_for_callback = get_all_audio_files()
-num_files = len(audio_files_for_callback)
-
+# A single pattern-matching Input covers every file button, so files added after
+# startup are wired up without re-registering the callback.
 @app.callback(
     Output('selected-audio-store', 'data'),
-    [Input(f'file-btn-{i}', 'n_clicks') for i in range(num_files)] if num_files > 0 else [Input('selected-audio-store', 'data')],
+    Input({'type': 'file-btn', 'index': ALL}, 'n_clicks'),
     prevent_initial_call=True
 )
-def update_selected_audio(*n_clicks_list):
+def update_selected_audio(n_clicks_list):
     """Update which audio file is selected based on button clicks."""
     ctx = callback_context
-    if not ctx.triggered:
+    if not ctx.triggered or not ctx.triggered[0]['value']:
         raise PreventUpdate
     
-    # Find which button was clicked
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
-    # Get the audio_id from the button in the layout
-    audio_files = get_all_audio_files()
-    if button_id.startswith('file-btn-'):
-        index = int(button_id.split('-')[-1])
-        if index < len(audio_files):
-            selected_id = audio_files[index]['audio_id']
-            print(f"[FILE_CLICK] User selected: {selected_id[:16]}...")
-            return selected_id
+    # The clicked button's id holds the audio_id directly
+    triggered = ctx.triggered_id
+    if isinstance(triggered, dict) and triggered.get('type') == 'file-btn':
+        selected_id = triggered['index']
+        print(f"[FILE_CLICK] User selected: {selected_id[:16]}...")
+        return selected_id
     
     raise PreventUpdate
 
@@ -1059,12 +1230,12 @@ def update_selected_audio(*n_clicks_list):
     Output('waveform-graph', 'figure', allow_duplicate=True),
     Output('dashboard-audio-id-display', 'children'),
     Output('segment-metadata', 'children', allow_duplicate=True),
+    Output('summary-data-store', 'data'),
+    Output('metadata-segment-store', 'data', allow_duplicate=True),
     Input('selected-audio-store', 'data'),
     prevent_initial_call='initial_duplicate'
 )
 def load_audio_file(audio_id):
-    import numpy as np
-    
     print(f"[LOAD_AUDIO] Loading audio_id: {audio_id}")
     
     # If no audio selected, use default
@@ -1076,31 +1247,36 @@ def load_audio_file(audio_id):
         return (
             None,
             [],
-            {'time': [], 'amplitude': [], 'amp_min': 0, 'amp_max': 0},
+            {'audio_id': None, 'amp_min': 0, 'amp_max': 0},
             html.Div("Select an audio file to begin", style={"padding": "20px", "color": "#6b7280", "textAlign": "center"}),
             {},
             "Select a file",
-            html.Div("Select an audio file to view analysis", style={"padding": "20px", "color": "#6b7280"})
+            html.Div("Select an audio file to view analysis", style={"padding": "20px", "color": "#6b7280"}),
+            None,
+            None
         )
     
     # Load audio data
     audio_path = f"uploads/{audio_id}.wav"
     if not Path(audio_path).exists():
         print(f"Audio file not found: {audio_path}")
-        return dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update
+        return (dash.no_update,) * 9
     
     print(f"Loading audio data for: {audio_id}")
     
-    # Extract waveform
-    time, amplitude = extract_waveform(audio_path)
+    # Fetch segments and summary together (one /bundle round-trip) in the background
+    # while the waveform loads, so the HTTP wait overlaps the disk/numpy work
+    bundle_future = fetch_bundle_async(audio_id)
     
-    # Cache min/max for performance (avoid recalculating on every update)
-    amp_min = float(amplitude.min())
-    amp_max = float(amplitude.max())
+    # Load waveform (cached in memory and on disk, see get_cached_waveform)
+    time, amplitude, amp_min, amp_max = get_cached_waveform(audio_id)
     
-    # Fetch segments
-    segments = fetch_segments(audio_id)
+    bundle = bundle_future.result()
+    segments = bundle["segments"]
     print(f"Loaded {len(segments)} segments")
+    prefetch_sidebar_bundles(audio_id)
+    clear_segment_starts(audio_id)
+    get_segment_starts(audio_id, segments)
     
     # Create audio player
     player = render_audio_player(audio_id)
@@ -1115,22 +1291,25 @@ def load_audio_file(audio_id):
     # Initial metadata (first segment)
     if segments and len(segments) > 0:
         metadata = render_metadata_panel(segments[0])
+        shown_segment = [segments[0]['start'], segments[0]['end']]
     else:
         metadata = html.Div("No segments available", style={"padding": "20px", "color": "#6b7280"})
+        shown_segment = None
     
     return (
         audio_id,
         segments,
         {
-            'time': time.tolist(),
-            'amplitude': amplitude.tolist(),
+            'audio_id': audio_id,
             'amp_min': amp_min,
             'amp_max': amp_max
         },
         player,
         fig,
         display_text,
-        metadata
+        metadata,
+        bundle["summary"],
+        shown_segment
     )
 
 
@@ -1188,7 +1367,6 @@ def create_persona(n_clicks, persona_id, display_name, emoji, description, promp
         # Add to backend config
         backend_config_path = Path("app/config/personas.py")
         dashboard_config_path = Path("dashboard/personas_config.py")
-        langflow_config_path = Path("app/services/langflow_client.py")
         
         # Read backend config
         with open(backend_config_path, 'r') as f:
@@ -1226,18 +1404,10 @@ def create_persona(n_clicks, persona_id, display_name, emoji, description, promp
         
         with open(dashboard_config_path, 'w') as f:
             f.write(dashboard_content)
+        bump_personas_version()
         
         # Update langflow prompts
-        with open(langflow_config_path, 'r') as f:
-            langflow_content = f.read()
-        
-        new_prompt_entry = f'''    "{persona_id}_chain": {json.dumps(parsed_prompt, indent=8).replace("        ", "    ")},
-}}'''
-        
-        langflow_content = langflow_content.replace("\n}", f"\n{new_prompt_entry}")
-        
-        with open(langflow_config_path, 'w') as f:
-            f.write(langflow_content)
+        save_persona_prompt(f"{persona_id}_chain", parsed_prompt)
         
         # Create worker file
         worker_template = f'''import json
@@ -1331,6 +1501,8 @@ def process_transcript(audio_id, transcript_segments, classifier_results):
 
 
 # Clientside callback to update current time from audio player
+# Only writes the store (and so only round-trips to the server) when the playhead
+# crosses into a new cursor bucket; paused or sub-bucket jitter stays in the browser
 app.clientside_callback(
     """
     function(n_intervals) {
@@ -1338,23 +1510,18 @@ app.clientside_callback(
         
         if (audioElement && audioElement.currentTime !== undefined && !isNaN(audioElement.currentTime)) {
             const currentTime = audioElement.currentTime;
+            const bucket = Math.floor(currentTime * %d);
             
-            // Initialize if needed
-            if (window.lastAudioTime === undefined) {
-                window.lastAudioTime = currentTime;
-            }
-            
-            // Only update if time has actually changed
-            if (Math.abs(currentTime - window.lastAudioTime) >= 0.1) {
-                console.log('[CLIENTSIDE] Audio time changed:', window.lastAudioTime, '->', currentTime);
-                window.lastAudioTime = currentTime;
+            // Only update if the playhead moved into a new cursor bucket
+            if (bucket !== window.lastAudioBucket) {
+                window.lastAudioBucket = bucket;
                 return currentTime;
             }
         }
         
         return window.dash_clientside.no_update;
     }
-    """,
+    """ % CURSOR_BUCKETS_PER_SECOND,
     Output('current-time-store', 'data'),
     Input('playback-sync', 'n_intervals'),
     prevent_initial_call=True
@@ -1390,64 +1557,64 @@ app.clientside_callback(
     Output("waveform-graph", "figure", allow_duplicate=True),
     Output("segment-metadata", "children", allow_duplicate=True),
     Output("user-clicked", "data", allow_duplicate=True),
+    Output("metadata-segment-store", "data", allow_duplicate=True),
     Input('current-time-store', 'data'),
     State("segments-store", "data"),
     State("waveform-data-store", "data"),
     State("user-clicked", "data"),
+    State("metadata-segment-store", "data"),
     prevent_initial_call=True
 )
-def auto_update_playback(current_time, segments, waveform_data, user_clicked):
-    import numpy as np
-    
+def auto_update_playback(current_time, segments, waveform_data, user_clicked, shown_segment):
     print(f"[AUTO_UPDATE] time={current_time}, user_clicked={user_clicked}, has_segments={bool(segments)}, has_waveform={bool(waveform_data)}")
     
     # If user just clicked, reset flag and don't update
     if user_clicked:
         print("[AUTO_UPDATE] User clicked, skipping update")
-        return dash.no_update, dash.no_update, False
+        return dash.no_update, dash.no_update, False, dash.no_update
     
     # Skip if no valid time or segments
     if current_time is None or current_time < 0:
         print(f"[AUTO_UPDATE] Invalid time: {current_time}")
-        return dash.no_update, dash.no_update, False
+        return dash.no_update, dash.no_update, False, dash.no_update
         
     if not segments:
         print("[AUTO_UPDATE] No segments")
-        return dash.no_update, dash.no_update, False
+        return dash.no_update, dash.no_update, False, dash.no_update
         
-    if not waveform_data or not waveform_data.get('time'):
-        print(f"[AUTO_UPDATE] No waveform data or time: {waveform_data.keys() if waveform_data else 'None'}")
-        return dash.no_update, dash.no_update, False
+    if not waveform_data or not waveform_data.get('audio_id'):
+        print(f"[AUTO_UPDATE] No waveform data: {waveform_data.keys() if waveform_data else 'None'}")
+        return dash.no_update, dash.no_update, False, dash.no_update
     
-    # Convert waveform data back to numpy arrays
-    time = np.array(waveform_data['time'])
-    amplitude = np.array(waveform_data['amplitude'])
+    audio_id = waveform_data['audio_id']
     
-    # Get cached min/max (performance optimization)
-    amp_min = waveform_data.get('amp_min')
-    amp_max = waveform_data.get('amp_max')
+    # Find active segment
+    seg_starts = get_segment_starts(audio_id, segments)
+    active_segment = find_active_segment(segments, seg_starts, current_time)
     
-    # Fallback to calculation if not cached
-    if amp_min is None or amp_max is None:
-        print("[AUTO_UPDATE] Min/max not cached, calculating...")
-        amp_min = float(amplitude.min())
-        amp_max = float(amplitude.max())
+    # The segment shown in this session's metadata panel lives in metadata-segment-store
+    # (per browser tab), so the panel is only re-rendered when playback enters another segment
+    segment_key = [active_segment['start'], active_segment['end']] if active_segment else []
+    segment_changed = shown_segment != segment_key
     
-    print(f"[AUTO_UPDATE] Rendering waveform at time {current_time:.2f}, amp_min={amp_min:.3f}, amp_max={amp_max:.3f}")
+    # Amplitude bounds were stored alongside the audio_id when the file was loaded
+    amp_min, amp_max = waveform_data['amp_min'], waveform_data['amp_max']
     
-    # Find active segment
-    active_segment = next(
-        (seg for seg in segments if seg["start"] <= current_time <= seg["end"]),
-        None
-    )
+    print(f"[AUTO_UPDATE] Moving cursor to {current_time:.2f}, amp_min={amp_min:.3f}, amp_max={amp_max:.3f}")
     
     if active_segment:
         print(f"[AUTO_UPDATE] Active segment: {active_segment.get('start')}-{active_segment.get('end')}")
     
-    # Update waveform with cursor (pass cached min/max for performance)
-    fig = render_waveform_with_highlight(time, amplitude, segments, cursor_position=current_time, amp_min=amp_min, amp_max=amp_max)
+    # Only the cursor line and the active-segment highlight change during playback, so
+    # patch layout.shapes instead of re-sending the figure with the whole waveform trace
+    fig = Patch()
+    fig['layout']['shapes'] = waveform_shapes(segments, current_time, amp_min, amp_max)
+    
+    # Only the cursor moved - leave the metadata panel as it is
+    if not segment_changed:
+        return fig, dash.no_update, False, dash.no_update
     
-    # Update metadata - always render to force UI update
+    # Update metadata for the newly active segment
     if active_segment:
         metadata = render_metadata_panel(active_segment)
     else:
@@ -1456,29 +1623,29 @@ def auto_update_playback(current_time, segments, waveform_data, user_clicked):
             style={"padding": "20px", "color": "#6b7280"}
         )
     
-    return fig, metadata, False
+    return fig, metadata, False, segment_key
 
 
 # Callback 5: Handle waveform clicks for seeking (note: clientside callback handles audio seeking)
 @app.callback(
     Output("segment-metadata", "children", allow_duplicate=True),
     Output("user-clicked", "data", allow_duplicate=True),
+    Output("metadata-segment-store", "data", allow_duplicate=True),
     Input("waveform-graph", "clickData"),
     State("segments-store", "data"),
+    State("current-audio-id", "data"),
     prevent_initial_call=True
 )
-def handle_waveform_click(click_data, segments):
+def handle_waveform_click(click_data, segments, audio_id):
     if click_data is None or not segments:
-        return dash.no_update, dash.no_update
+        return dash.no_update, dash.no_update, dash.no_update
     
     # Get clicked time from waveform
     clicked_time = click_data['points'][0]['x']
     
     # Find the segment containing this time
-    active_segment = next(
-        (seg for seg in segments if seg["start"] <= clicked_time <= seg["end"]),
-        None
-    )
+    seg_starts = get_segment_starts(audio_id, segments)
+    active_segment = find_active_segment(segments, seg_starts, clicked_time)
     
     # Update metadata
     metadata = render_metadata_panel(active_segment) if active_segment else html.Div(
@@ -1487,80 +1654,58 @@ def handle_waveform_click(click_data, segments):
     )
     
     # Set user-clicked flag
-    return metadata, True
+    shown_segment = [active_segment['start'], active_segment['end']] if active_segment else []
+    return metadata, True, shown_segment
 
 
 # ============================================================================
 # PHASE 3 CALLBACKS: Collapsible Summary Panel on Main Dashboard
 # ============================================================================
 
-# Callback 6.1: Fetch summary data when audio changes (Phase 3)
-@app.callback(
-    Output('summary-data-store', 'data'),
-    Input('current-audio-id', 'data'),
-    prevent_initial_call=True
-)
-def fetch_summary_data(audio_id):
-    """Fetch summary when audio changes."""
-    import requests
-    
-    if not audio_id:
-        return None
-    
-    try:
-        response = requests.get(f"http://localhost:8000/summary/{audio_id}", timeout=5)
-        if response.status_code == 200:
-            return response.json()
-    except Exception as e:
-        print(f"Error fetching summary for {audio_id}: {e}")
-    
-    return None
+# Callback 6.1: Summary data arrives with the /bundle fetch in load_audio_file (Callback 2)
 
 
 # Callback 6.2: Update summary panel when data is available (Phase 3)
+# Skips the render (and the DOM patch) when the store fires with the data already shown
 @app.callback(
     Output('summary-panel-container', 'children'),
+    Output('summary-panel-hash', 'data'),
     Input('summary-data-store', 'data'),
     State('summary-collapsed', 'data'),
+    State('summary-panel-hash', 'data'),
     prevent_initial_call=True
 )
-def update_summary_panel(summary_data, is_collapsed):
+def update_summary_panel(summary_data, is_collapsed, last_digest):
     """Render collapsible summary panel on main dashboard."""
-    personas = get_all_personas()
+    digest = summary_digest(summary_data)
+    if digest == last_digest:
+        raise PreventUpdate
     
     if not summary_data:
         return html.Div(
             "Summary loading...",
             style={"padding": "16px", "color": "#6b7280", "fontStyle": "italic"}
-        )
+        ), digest
     
-    # Use the summary_panel component to render
-    return render_collapsible_summary(personas, summary_data, is_expanded=not is_collapsed)
+    # Use the summary_panel component to render (cached per summary/collapse state)
+    return get_cached_summary_panel('collapsible', summary_data, is_collapsed), digest
 
 
-# Callback 6.3: Toggle summary collapse state (Phase 3) - SIMPLIFIED
-# Only update the collapse state store. The panel re-render is handled by update_summary_panel.
-@app.callback(
+# Callback 6.3: Toggle summary collapse state (Phase 3) - clientside
+# Pure UI: flips the store and the body/button styles in the browser (assets/summary.js),
+# so collapsing never round-trips to the server or re-renders the panel.
+app.clientside_callback(
+    ClientsideFunction(namespace='summary', function_name='toggle'),
     Output('summary-collapsed', 'data'),
-    Output('summary-panel-container', 'children', allow_duplicate=True),
+    Output('summary-collapse-content', 'style'),
+    Output('summary-collapse-toggle', 'style'),
+    Output('summary-collapse-arrow', 'children'),
     Input('summary-collapse-toggle', 'n_clicks'),
     State('summary-collapsed', 'data'),
-    State('summary-data-store', 'data'),
+    State('summary-collapse-content', 'style'),
+    State('summary-collapse-toggle', 'style'),
     prevent_initial_call=True
 )
-def toggle_summary_collapse(n_clicks, is_collapsed, summary_data):
-    """Toggle the collapse state and re-render the summary panel."""
-    if summary_data is None:
-        raise PreventUpdate
-    
-    # Toggle state
-    new_collapsed = not is_collapsed
-    
-    # Re-render the entire panel with new state
-    personas = get_all_personas()
-    new_panel = render_collapsible_summary(personas, summary_data, is_expanded=not new_collapsed)
-    
-    return new_collapsed, new_panel
 
 
 # ============================================================================
@@ -1568,23 +1713,33 @@ def toggle_summary_collapse(n_clicks, is_collapsed, summary_data):
 # ============================================================================
 
 # Callback 7: Populate Summary Tab (Phase 4)
+# Renders only while the Summary tab is open; switching to it renders whatever
+# arrived in the meantime (the digest check skips it if nothing changed)
 @app.callback(
     Output("summary-content", "children"),
+    Output("summary-tab-hash", "data"),
     Input("summary-data-store", "data"),
+    Input("main-tabs", "value"),
+    State("summary-tab-hash", "data"),
     prevent_initial_call=False
 )
-def update_summary_tab(summary_data):
+def update_summary_tab(summary_data, active_tab, last_digest):
     """Generate summary statistics visualization for Summary Tab."""
-    personas = get_all_personas()
+    if active_tab != "summary-tab":
+        raise PreventUpdate
+    
+    digest = summary_digest(summary_data)
+    if digest == last_digest:
+        raise PreventUpdate
     
     if not summary_data:
         return html.Div(
             "Select an audio file to view summary",
             style={"padding": "40px", "color": "#6b7280", "textAlign": "center", "fontSize": "16px"}
-        )
+        ), digest
     
-    # Use the summary_panel component to render detailed summary
-    return render_detailed_summary(personas, summary_data)
+    # Use the summary_panel component to render detailed summary (cached)
+    return get_cached_summary_panel('detailed', summary_data), digest
 
 
 if __name__ == "__main__":
@@ -1592,4 +1747,6 @@ if __name__ == "__main__":
     print(f"📊 Dashboard available at: http://0.0.0.0:5000")
     print("Press Ctrl+C to stop\n")
     
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    # Debugger and reloader (a second process) only when asked for
+    debug = os.environ.get("SONICLAYER_DEBUG", "0") == "1"
+    app.run(host="0.0.0.0", port=5000, debug=debug, use_reloader=debug)
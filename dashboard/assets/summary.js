@@ -0,0 +1,20 @@
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    summary: {
+        // Collapse/expand the summary panel without a server round-trip.
+        // Only display/borderRadius change; the rest of each style is preserved.
+        toggle: function(n_clicks, collapsed, content_style, button_style) {
+            if (!n_clicks) {
+                throw window.dash_clientside.PreventUpdate;
+            }
+            
+            var new_collapsed = !collapsed;
+            
+            return [
+                new_collapsed,
+                Object.assign({}, content_style, {display: new_collapsed ? 'none' : 'grid'}),
+                Object.assign({}, button_style, {borderRadius: new_collapsed ? '8px' : '8px 8px 0 0'}),
+                new_collapsed ? '▶' : '▼'
+            ];
+        }
+    }
+});
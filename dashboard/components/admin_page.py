@@ -1,210 +1,188 @@
 """Admin page component for managing personas."""
+import functools
 from dash import html, dcc
-from personas_config import get_all_personas
+
+# Shared style dicts: the layout is style-heavy, so build each style once at import
+# instead of allocating fresh literals for every field on every render
+_PAGE_STYLE = {"padding": "40px", "maxWidth": "1400px", "margin": "0 auto"}
+_HEADER_STYLE = {"marginBottom": "32px"}
+_TITLE_STYLE = {"margin": "0 0 8px 0", "color": "#111827", "fontSize": "24px"}
+_SUBTITLE_STYLE = {"margin": "0", "color": "#6b7280", "fontSize": "14px"}
+_COLUMNS_STYLE = {"display": "flex", "marginBottom": "20px"}
+_SECTION_TITLE_STYLE = {"margin": "0 0 20px 0", "color": "#111827", "fontSize": "18px"}
+
+_FORM_COLUMN_STYLE = {
+    "flex": "1",
+    "backgroundColor": "#ffffff",
+    "padding": "24px",
+    "borderRadius": "8px",
+    "border": "1px solid #e5e7eb",
+    "marginRight": "20px"
+}
+_LIST_COLUMN_STYLE = {
+    "width": "350px",
+    "backgroundColor": "#ffffff",
+    "padding": "24px",
+    "borderRadius": "8px",
+    "border": "1px solid #e5e7eb",
+    "maxHeight": "600px",
+    "overflowY": "auto"
+}
+
+_FIELD_STYLE = {"marginBottom": "16px"}
+_FIELD_LAST_STYLE = {"marginBottom": "20px"}
+_LABEL_STYLE = {
+    "display": "block",
+    "marginBottom": "6px",
+    "fontWeight": "500",
+    "fontSize": "14px",
+    "color": "#374151"
+}
+_INPUT_STYLE = {
+    "width": "100%",
+    "padding": "10px",
+    "border": "1px solid #d1d5db",
+    "borderRadius": "6px",
+    "fontSize": "14px",
+    "boxSizing": "border-box"
+}
+_PROMPT_INPUT_STYLE = {
+    **_INPUT_STYLE,
+    "height": "200px",
+    "fontSize": "13px",
+    "fontFamily": "monospace",
+    "resize": "vertical"
+}
+_HINT_STYLE = {"color": "#6b7280", "fontSize": "12px", "marginTop": "4px", "display": "block"}
+_SUBMIT_BUTTON_STYLE = {
+    "width": "100%",
+    "padding": "12px",
+    "backgroundColor": "#3b82f6",
+    "color": "white",
+    "border": "none",
+    "borderRadius": "6px",
+    "fontSize": "14px",
+    "fontWeight": "600",
+    "cursor": "pointer",
+    "transition": "background-color 0.2s"
+}
+_FEEDBACK_STYLE = {"marginTop": "12px"}
+_PAGER_BUTTON_STYLE = {
+    "padding": "6px 12px",
+    "backgroundColor": "#ffffff",
+    "color": "#374151",
+    "border": "1px solid #d1d5db",
+    "borderRadius": "4px",
+    "cursor": "pointer",
+    "fontSize": "13px"
+}
+_PAGER_LABEL_STYLE = {"fontSize": "12px", "color": "#6b7280"}
+_HIDDEN_STYLE = {"display": "none"}
+
 
 def render_admin_page():
-    """Render the admin page for persona management."""
-    personas = get_all_personas()
+    """Render the admin page for persona management.
     
+    The persona cards are filled into `personas-list` by the render_persona_cards
+    callback, so nothing here depends on the persona registry and the whole tree
+    is built once and reused.
+    """
+    return _build_admin_scaffold()
+
+
+@functools.cache
+def _build_admin_scaffold():
+    """Build the static admin page tree (memoized; callers must not mutate it)."""
     return html.Div([
         # Header
         html.Div([
-            html.H2("⚙️ Persona Admin Panel", style={
-                "margin": "0 0 8px 0",
-                "color": "#111827",
-                "fontSize": "24px"
-            }),
-            html.P("Add and manage audience personas for audio analysis", style={
-                "margin": "0",
-                "color": "#6b7280",
-                "fontSize": "14px"
-            })
-        ], style={
-            "marginBottom": "32px"
-        }),
+            html.H2("⚙️ Persona Admin Panel", style=_TITLE_STYLE),
+            html.P("Add and manage audience personas for audio analysis", style=_SUBTITLE_STYLE)
+        ], style=_HEADER_STYLE),
         
         # Two columns layout
         html.Div([
             # Left column - Add New Persona Form
             html.Div([
-                html.H3("➕ Add New Persona", style={
-                    "margin": "0 0 20px 0",
-                    "color": "#111827",
-                    "fontSize": "18px"
-                }),
+                html.H3("➕ Add New Persona", style=_SECTION_TITLE_STYLE),
                 
                 # Form
                 html.Div([
                     # Persona ID
                     html.Div([
-                        html.Label("Persona ID *", style={
-                            "display": "block",
-                            "marginBottom": "6px",
-                            "fontWeight": "500",
-                            "fontSize": "14px",
-                            "color": "#374151"
-                        }),
+                        html.Label("Persona ID *", style=_LABEL_STYLE),
                         dcc.Input(
                             id="persona-id-input",
                             type="text",
                             placeholder="e.g., millennial, boomer, techie",
-                            style={
-                                "width": "100%",
-                                "padding": "10px",
-                                "border": "1px solid #d1d5db",
-                                "borderRadius": "6px",
-                                "fontSize": "14px",
-                                "boxSizing": "border-box"
-                            }
+                            style=_INPUT_STYLE
                         ),
-                        html.Small("Lowercase, no spaces (use underscores)", style={
-                            "color": "#6b7280",
-                            "fontSize": "12px",
-                            "marginTop": "4px",
-                            "display": "block"
-                        })
-                    ], style={"marginBottom": "16px"}),
+                        html.Small("Lowercase, no spaces (use underscores)", style=_HINT_STYLE)
+                    ], style=_FIELD_STYLE),
                     
                     # Display Name
                     html.Div([
-                        html.Label("Display Name *", style={
-                            "display": "block",
-                            "marginBottom": "6px",
-                            "fontWeight": "500",
-                            "fontSize": "14px",
-                            "color": "#374151"
-                        }),
+                        html.Label("Display Name *", style=_LABEL_STYLE),
                         dcc.Input(
                             id="persona-name-input",
                             type="text",
                             placeholder="e.g., Millennial, Baby Boomer, Tech Enthusiast",
-                            style={
-                                "width": "100%",
-                                "padding": "10px",
-                                "border": "1px solid #d1d5db",
-                                "borderRadius": "6px",
-                                "fontSize": "14px",
-                                "boxSizing": "border-box"
-                            }
+                            style=_INPUT_STYLE
                         )
-                    ], style={"marginBottom": "16px"}),
+                    ], style=_FIELD_STYLE),
                     
                     # Emoji
                     html.Div([
-                        html.Label("Emoji", style={
-                            "display": "block",
-                            "marginBottom": "6px",
-                            "fontWeight": "500",
-                            "fontSize": "14px",
-                            "color": "#374151"
-                        }),
+                        html.Label("Emoji", style=_LABEL_STYLE),
                         dcc.Input(
                             id="persona-emoji-input",
                             type="text",
                             placeholder="e.g., 🎯 👴 💻",
                             maxLength=2,
-                            style={
-                                "width": "100%",
-                                "padding": "10px",
-                                "border": "1px solid #d1d5db",
-                                "borderRadius": "6px",
-                                "fontSize": "14px",
-                                "boxSizing": "border-box"
-                            }
+                            style=_INPUT_STYLE
                         )
-                    ], style={"marginBottom": "16px"}),
+                    ], style=_FIELD_STYLE),
                     
                     # Description
                     html.Div([
-                        html.Label("Description", style={
-                            "display": "block",
-                            "marginBottom": "6px",
-                            "fontWeight": "500",
-                            "fontSize": "14px",
-                            "color": "#374151"
-                        }),
+                        html.Label("Description", style=_LABEL_STYLE),
                         dcc.Input(
                             id="persona-description-input",
                             type="text",
                             placeholder="Brief description of this persona",
-                            style={
-                                "width": "100%",
-                                "padding": "10px",
-                                "border": "1px solid #d1d5db",
-                                "borderRadius": "6px",
-                                "fontSize": "14px",
-                                "boxSizing": "border-box"
-                            }
+                            style=_INPUT_STYLE
                         )
-                    ], style={"marginBottom": "20px"}),
+                    ], style=_FIELD_LAST_STYLE),
                     
                     # JSON Prompt
                     html.Div([
-                        html.Label("Evaluation Prompt (JSON) *", style={
-                            "display": "block",
-                            "marginBottom": "6px",
-                            "fontWeight": "500",
-                            "fontSize": "14px",
-                            "color": "#374151"
-                        }),
+                        html.Label("Evaluation Prompt (JSON) *", style=_LABEL_STYLE),
                         dcc.Textarea(
                             id="persona-prompt-input",
                             placeholder='{\n  "system": "You are a [persona] evaluator...",\n  "user_template": "Evaluate this segment..."\n}',
-                            style={
-                                "width": "100%",
-                                "height": "200px",
-                                "padding": "10px",
-                                "border": "1px solid #d1d5db",
-                                "borderRadius": "6px",
-                                "fontSize": "13px",
-                                "fontFamily": "monospace",
-                                "boxSizing": "border-box",
-                                "resize": "vertical"
-                            }
+                            style=_PROMPT_INPUT_STYLE
                         )
-                    ], style={"marginBottom": "20px"}),
+                    ], style=_FIELD_LAST_STYLE),
                     
                     # Submit Button
                     html.Button(
                         "Create Persona",
                         id="create-persona-button",
                         n_clicks=0,
-                        style={
-                            "width": "100%",
-                            "padding": "12px",
-                            "backgroundColor": "#3b82f6",
-                            "color": "white",
-                            "border": "none",
-                            "borderRadius": "6px",
-                            "fontSize": "14px",
-                            "fontWeight": "600",
-                            "cursor": "pointer",
-                            "transition": "background-color 0.2s"
-                        }
+                        style=_SUBMIT_BUTTON_STYLE
                     ),
                     
                     # Feedback message
                     html.Div(
                         id="creation-feedback",
-                        style={"marginTop": "12px"}
+                        style=_FEEDBACK_STYLE
                     )
                 ])
-            ], style={
-                "flex": "1",
-                "backgroundColor": "#ffffff",
-                "padding": "24px",
-                "borderRadius": "8px",
-                "border": "1px solid #e5e7eb",
-                "marginRight": "20px"
-            }),
+            ], style=_FORM_COLUMN_STYLE),
             
             # Right column - Existing Personas List
             html.Div([
-                html.H3("👥 Existing Personas", style={
-                    "margin": "0 0 20px 0",
-                    "color": "#111827",
-                    "fontSize": "18px"
-                }),
+                html.H3("👥 Existing Personas", style=_SECTION_TITLE_STYLE),
                 
                 # Store to track which persona is being edited
                 dcc.Store(id="editing-persona-id", data=None),
@@ -213,25 +191,18 @@ def render_admin_page():
                 dcc.Store(id="re-evaluate-status", data=None),
                 
                 # Toast notification for save feedback
-                html.Div(id="save-toast", style={"display": "none"}),
+                html.Div(id="save-toast", style=_HIDDEN_STYLE),
                 
                 # Container for persona cards (will be updated by callback)
-                html.Div(id="personas-list")
-            ], style={
-                "width": "350px",
-                "backgroundColor": "#ffffff",
-                "padding": "24px",
-                "borderRadius": "8px",
-                "border": "1px solid #e5e7eb",
-                "maxHeight": "600px",
-                "overflowY": "auto"
-            })
-        ], style={
-            "display": "flex",
-            "marginBottom": "20px"
-        })
-    ], style={
-        "padding": "40px",
-        "maxWidth": "1400px",
-        "margin": "0 auto"
-    })
+                html.Div(id="personas-list"),
+                
+                # Pager for the persona list (hidden while everything fits on one page)
+                dcc.Store(id="personas-page", data=0),
+                html.Div([
+                    html.Button("‹ Prev", id="personas-prev-page", n_clicks=0, style=_PAGER_BUTTON_STYLE),
+                    html.Span(id="personas-page-label", style=_PAGER_LABEL_STYLE),
+                    html.Button("Next ›", id="personas-next-page", n_clicks=0, style=_PAGER_BUTTON_STYLE)
+                ], id="personas-pager", style=_HIDDEN_STYLE)
+            ], style=_LIST_COLUMN_STYLE)
+        ], style=_COLUMNS_STYLE)
+    ], style=_PAGE_STYLE)
@@ -1,21 +1,28 @@
+import functools
 from dash import html
 
+_AUDIO_STYLE = {
+    'width': '100%',
+    'borderRadius': '8px',
+    'outline': 'none'
+}
+_CONTAINER_STYLE = {
+    'marginBottom': '20px',
+    'padding': '10px',
+    'backgroundColor': '#ffffff',
+    'borderRadius': '8px',
+    'border': '1px solid #e5e7eb'
+}
+
+
+# The player tree depends only on audio_id, so it is built once per file and reused
+@functools.lru_cache(maxsize=64)
 def render_audio_player(audio_id: str):
     return html.Div([
         html.Audio(
             id="audio-player",
             src=f"/audio/{audio_id}",
             controls=True,
-            style={
-                'width': '100%',
-                'borderRadius': '8px',
-                'outline': 'none'
-            }
+            style=_AUDIO_STYLE
         )
-    ], style={
-        'marginBottom': '20px',
-        'padding': '10px',
-        'backgroundColor': '#ffffff',
-        'borderRadius': '8px',
-        'border': '1px solid #e5e7eb'
-    })
+    ], style=_CONTAINER_STYLE)
@@ -1,145 +1,130 @@
-"""File browser component for displaying available audio files."""
+"""
+File browser component for displaying available audio files.
+
+Not mounted in app.layout: the dashboard selects files from the sidebar.
+"""
 from dash import html, dcc
-import sys
-from pathlib import Path
 
-# Add parent directory to path to import utils
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# dashboard/ is already on sys.path: app.py runs as a script from that directory
 from utils.audio_scanner import get_all_audio_files
 
+# Shared style dicts, referenced by every card instead of rebuilt per card
+_PAGE_STYLE = {"padding": "40px", "maxWidth": "1400px", "margin": "0 auto"}
+_EMPTY_PAGE_STYLE = {"padding": "40px"}
+_HEADER_STYLE = {"marginBottom": "32px"}
+_TITLE_STYLE = {"margin": "0 0 8px 0", "color": "#111827", "fontSize": "24px"}
+_SUBTITLE_STYLE = {"margin": "0", "color": "#6b7280", "fontSize": "14px"}
+_GRID_STYLE = {
+    "display": "grid",
+    "gridTemplateColumns": "repeat(auto-fill, minmax(350px, 1fr))",
+    "gap": "20px"
+}
+
+_CARD_STYLE = {
+    "backgroundColor": "#ffffff",
+    "padding": "24px",
+    "borderRadius": "8px",
+    "border": "1px solid #e5e7eb",
+    "boxShadow": "0 1px 3px rgba(0,0,0,0.1)",
+    "marginBottom": "16px"
+}
+_CARD_HEADER_STYLE = {"display": "flex", "alignItems": "center", "marginBottom": "16px"}
+_CARD_ICON_STYLE = {"fontSize": "32px", "marginRight": "12px", "flexShrink": "0"}
+_CARD_TITLE_STYLE = {"flex": "1", "minWidth": "0", "overflow": "hidden"}
+_CARD_ID_STYLE = {"fontSize": "16px", "fontWeight": "600", "color": "#111827", "marginBottom": "4px"}
+_CARD_FILENAME_STYLE = {
+    "fontSize": "11px",
+    "color": "#6b7280",
+    "fontFamily": "monospace",
+    "wordBreak": "break-all",
+    "lineHeight": "1.4"
+}
+_META_STYLE = {"marginBottom": "16px"}
+_META_ROW_STYLE = {"marginBottom": "8px"}
+_META_LABEL_STYLE = {"color": "#6b7280", "fontSize": "14px"}
+_META_VALUE_STYLE = {"fontWeight": "600", "fontSize": "14px"}
+_VIEW_LINK_STYLE = {
+    "display": "inline-block",
+    "padding": "10px 20px",
+    "backgroundColor": "#3b82f6",
+    "color": "white",
+    "textDecoration": "none",
+    "borderRadius": "6px",
+    "fontSize": "14px",
+    "fontWeight": "600",
+    "textAlign": "center",
+    "cursor": "pointer",
+    "transition": "background-color 0.2s"
+}
+
 
 def render_file_browser():
     """Render the file browser page showing all available audio files."""
-    audio_files = get_all_audio_files()
+    return _build_file_browser(get_all_audio_files())
+
+
+def _meta_row(label, value, last=False):
+    """One label/value line of a card's metadata block; the last row has no bottom margin."""
+    spans = [
+        html.Span(label, style=_META_LABEL_STYLE),
+        html.Span(value, style=_META_VALUE_STYLE)
+    ]
+    return html.Div(spans) if last else html.Div(spans, style=_META_ROW_STYLE)
+
+
+def _build_card(audio):
+    """Build one audio file card."""
+    # Shorten audio_id for display
+    short_id = f'{audio["audio_id"][:16]}...'
     
+    return html.Div([
+        # Header with audio icon and ID
+        html.Div([
+            html.Span("🎵", style=_CARD_ICON_STYLE),
+            html.Div([
+                html.Div(short_id, style=_CARD_ID_STYLE),
+                html.Div(audio["filename"], style=_CARD_FILENAME_STYLE)
+            ], style=_CARD_TITLE_STYLE)
+        ], style=_CARD_HEADER_STYLE),
+        
+        # Metadata
+        html.Div([
+            _meta_row("📊 Segments: ", f'{audio["num_segments"]}'),
+            _meta_row("💾 Size: ", f"{audio['file_size_mb']} MB"),
+            _meta_row("📅 Uploaded: ", audio["upload_date"], last=True)
+        ], style=_META_STYLE),
+        
+        # View Dashboard button
+        dcc.Link(
+            "View Dashboard →",
+            href=f"/dashboard?audio_id={audio['audio_id']}",
+            style=_VIEW_LINK_STYLE
+        )
+    ], style=_CARD_STYLE)
+
+
+def _build_file_browser(audio_files):
+    """Build the file browser tree for the scanned audio files."""
     if not audio_files:
         return html.Div([
             html.Div([
-                html.H2("📁 Audio Files", style={
-                    "margin": "0 0 8px 0",
-                    "color": "#111827",
-                    "fontSize": "24px"
-                }),
-                html.P("No audio files found in uploads folder", style={
-                    "margin": "0",
-                    "color": "#6b7280",
-                    "fontSize": "14px"
-                })
+                html.H2("📁 Audio Files", style=_TITLE_STYLE),
+                html.P("No audio files found in uploads folder", style=_SUBTITLE_STYLE)
             ])
-        ], style={"padding": "40px"})
+        ], style=_EMPTY_PAGE_STYLE)
     
     # Create audio file cards
-    file_cards = []
-    
-    for audio in audio_files:
-        # Shorten audio_id for display
-        short_id = audio["audio_id"][:16] + "..."
-        
-        card = html.Div([
-            # Header with audio icon and ID
-            html.Div([
-                html.Span("🎵", style={
-                    "fontSize": "32px",
-                    "marginRight": "12px",
-                    "flexShrink": "0"
-                }),
-                html.Div([
-                    html.Div(short_id, style={
-                        "fontSize": "16px",
-                        "fontWeight": "600",
-                        "color": "#111827",
-                        "marginBottom": "4px"
-                    }),
-                    html.Div(audio["filename"], style={
-                        "fontSize": "11px",
-                        "color": "#6b7280",
-                        "fontFamily": "monospace",
-                        "wordBreak": "break-all",
-                        "lineHeight": "1.4"
-                    })
-                ], style={
-                    "flex": "1",
-                    "minWidth": "0",
-                    "overflow": "hidden"
-                })
-            ], style={
-                "display": "flex",
-                "alignItems": "center",
-                "marginBottom": "16px"
-            }),
-            
-            # Metadata
-            html.Div([
-                html.Div([
-                    html.Span("📊 Segments: ", style={"color": "#6b7280", "fontSize": "14px"}),
-                    html.Span(str(audio["num_segments"]), style={"fontWeight": "600", "fontSize": "14px"})
-                ], style={"marginBottom": "8px"}),
-                
-                html.Div([
-                    html.Span("💾 Size: ", style={"color": "#6b7280", "fontSize": "14px"}),
-                    html.Span(f"{audio['file_size_mb']} MB", style={"fontWeight": "600", "fontSize": "14px"})
-                ], style={"marginBottom": "8px"}),
-                
-                html.Div([
-                    html.Span("📅 Uploaded: ", style={"color": "#6b7280", "fontSize": "14px"}),
-                    html.Span(audio["upload_date"], style={"fontWeight": "600", "fontSize": "14px"})
-                ])
-            ], style={"marginBottom": "16px"}),
-            
-            # View Dashboard button
-            dcc.Link(
-                "View Dashboard →",
-                href=f"/dashboard?audio_id={audio['audio_id']}",
-                style={
-                    "display": "inline-block",
-                    "padding": "10px 20px",
-                    "backgroundColor": "#3b82f6",
-                    "color": "white",
-                    "textDecoration": "none",
-                    "borderRadius": "6px",
-                    "fontSize": "14px",
-                    "fontWeight": "600",
-                    "textAlign": "center",
-                    "cursor": "pointer",
-                    "transition": "background-color 0.2s"
-                }
-            )
-        ], style={
-            "backgroundColor": "#ffffff",
-            "padding": "24px",
-            "borderRadius": "8px",
-            "border": "1px solid #e5e7eb",
-            "boxShadow": "0 1px 3px rgba(0,0,0,0.1)",
-            "marginBottom": "16px"
-        })
-        
-        file_cards.append(card)
+    num_files = len(audio_files)
+    plural = "s" if num_files != 1 else ""
+    file_cards = [_build_card(audio) for audio in audio_files]
     
     return html.Div([
         # Header
         html.Div([
-            html.H2("📁 Audio Files", style={
-                "margin": "0 0 8px 0",
-                "color": "#111827",
-                "fontSize": "24px"
-            }),
-            html.P(f"Found {len(audio_files)} audio file{'s' if len(audio_files) != 1 else ''} in uploads", style={
-                "margin": "0",
-                "color": "#6b7280",
-                "fontSize": "14px"
-            })
-        ], style={
-            "marginBottom": "32px"
-        }),
+            html.H2("📁 Audio Files", style=_TITLE_STYLE),
+            html.P(f"Found {num_files} audio file{plural} in uploads", style=_SUBTITLE_STYLE)
+        ], style=_HEADER_STYLE),
         
         # File cards grid
-        html.Div(file_cards, style={
-            "display": "grid",
-            "gridTemplateColumns": "repeat(auto-fill, minmax(350px, 1fr))",
-            "gap": "20px"
-        })
-    ], style={
-        "padding": "40px",
-        "maxWidth": "1400px",
-        "margin": "0 auto"
-    })
+        html.Div(file_cards, style=_GRID_STYLE)
+    ], style=_PAGE_STYLE)
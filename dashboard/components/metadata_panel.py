@@ -1,15 +1,122 @@
 """Metadata panel component for displaying segment information."""
+from functools import lru_cache
 from dash import html
 
+# Static style dicts shared across renders; only the score-colored styles are built per card
+_EMOJI_STYLE = {"fontSize": "24px", "marginRight": "8px"}
+_NAME_STYLE = {"fontWeight": "bold", "fontSize": "16px"}
+_INLINE_BLOCK_STYLE = {"display": "inline-block"}
+_ROW_STYLE = {"marginBottom": "8px"}
+
+_PENDING_HEADER_STYLE = {"marginBottom": "8px"}
+_PENDING_TEXT_STYLE = {"fontSize": "14px", "color": "#6b7280", "fontStyle": "italic"}
+_PENDING_CARD_STYLE = {
+    "padding": "16px",
+    "marginBottom": "12px",
+    "borderRadius": "8px",
+    "border": "2px solid #e5e7eb",
+    "backgroundColor": "#f9fafb"
+}
+
+_CARD_HEADER_STYLE = {"marginBottom": "12px"}
+_OPINION_STYLE = {"color": "#374151"}
+_OPINION_ROW_STYLE = {"marginBottom": "8px", "fontSize": "14px"}
+_RATIONALE_STYLE = {"color": "#6b7280", "fontSize": "13px"}
+_CONFIDENCE_LABEL_STYLE = {"fontSize": "13px"}
+_CONFIDENCE_TRACK_STYLE = {
+    "height": "8px",
+    "backgroundColor": "#e5e7eb",
+    "borderRadius": "4px",
+    "marginTop": "4px",
+    "overflow": "hidden"
+}
+_CONFIDENCE_TEXT_STYLE = {"fontSize": "12px", "color": "#6b7280", "marginTop": "2px", "display": "block"}
+_CARD_NOTE_STYLE = {"color": "#6b7280", "fontSize": "12px", "fontStyle": "italic"}
+_CARD_NOTE_ROW_STYLE = {"marginTop": "8px"}
+
+_EMPTY_PANEL_STYLE = {"padding": "20px", "textAlign": "center", "color": "#6b7280", "fontStyle": "italic"}
+_PANEL_STYLE = {"padding": "20px", "height": "100%", "overflowY": "auto"}
+_PANEL_TITLE_STYLE = {"marginBottom": "8px", "color": "#111827"}
+_SEGMENT_HEADER_STYLE = {"marginBottom": "16px"}
+_TAGS_ROW_STYLE = {"marginBottom": "12px"}
+_TAG_ICON_STYLE = {"marginRight": "4px"}
+_TOPIC_TAG_STYLE = {
+    "backgroundColor": "#dbeafe",
+    "padding": "2px 8px",
+    "borderRadius": "4px",
+    "fontSize": "13px",
+    "marginRight": "12px"
+}
+_TONE_TAG_STYLE = {"backgroundColor": "#fef3c7", "padding": "2px 8px", "borderRadius": "4px", "fontSize": "13px"}
+_TRANSCRIPT_LABEL_STYLE = {"display": "block", "marginBottom": "8px"}
+_TRANSCRIPT_STYLE = {
+    "padding": "12px",
+    "backgroundColor": "#f9fafb",
+    "borderRadius": "6px",
+    "fontSize": "14px",
+    "lineHeight": "1.6",
+    "color": "#374151",
+    "border": "1px solid #e5e7eb",
+    "maxHeight": "120px",
+    "overflowY": "auto"
+}
+_TRANSCRIPT_BLOCK_STYLE = {"marginBottom": "20px"}
+_PERSONAS_TITLE_STYLE = {"marginBottom": "12px", "color": "#111827"}
+_NOTE_STYLE = {
+    "padding": "8px 12px",
+    "backgroundColor": "#fef3c7",
+    "borderRadius": "6px",
+    "fontSize": "13px",
+    "border": "1px solid #fbbf24"
+}
+_NOTE_BLOCK_STYLE = {"marginTop": "12px"}
+
+
+_GREEN = "#10b981"  # Green - success
+_AMBER = "#f59e0b"  # Amber - neutral
+_RED = "#ef4444"  # Red - warning
+
+# Integer scores 0-5 resolve with one indexed load
+_SCORE_COLORS = (_RED, _RED, _RED, _AMBER, _GREEN, _GREEN)
+
+# Score-colored styles, built once per color and shared by every card of that color
+_BADGE_STYLE_BY_COLOR = {
+    color: {
+        "display": "inline-block",
+        "float": "right",
+        "backgroundColor": color,
+        "color": "white",
+        "padding": "4px 12px",
+        "borderRadius": "16px",
+        "fontWeight": "bold",
+        "fontSize": "14px"
+    }
+    for color in (_GREEN, _AMBER, _RED)
+}
+_CARD_STYLE_BY_COLOR = {
+    color: {
+        "padding": "16px",
+        "marginBottom": "12px",
+        "borderRadius": "8px",
+        "border": f"2px solid {color}",
+        "backgroundColor": "#ffffff",
+        "boxShadow": "0 1px 3px rgba(0,0,0,0.1)"
+    }
+    for color in (_GREEN, _AMBER, _RED)
+}
+
 
 def get_score_color(score):
     """Get color based on score (1-5 scale)"""
+    if type(score) is int and 0 <= score <= 5:
+        return _SCORE_COLORS[score]
+    # Fractional or out-of-range scores: >= 4 green, exactly 3 amber, else red
     if score >= 4:
-        return "#10b981"  # Green - success
+        return _GREEN
     elif score == 3:
-        return "#f59e0b"  # Amber - neutral
+        return _AMBER
     else:
-        return "#ef4444"  # Red - warning
+        return _RED
 
 
 def render_persona_card(persona_name, persona_data, emoji):
@@ -28,112 +135,120 @@ def render_persona_card(persona_name, persona_data, emoji):
         return html.Div(
             [
                 html.Div([
-                    html.Span(emoji, style={"fontSize": "24px", "marginRight": "8px"}),
-                    html.Span(persona_name, style={"fontWeight": "bold", "fontSize": "16px"}),
-                ], style={"marginBottom": "8px"}),
-                html.Div("⏳ Processing...", style={
-                    "fontSize": "14px",
-                    "color": "#6b7280",
-                    "fontStyle": "italic"
-                })
+                    html.Span(emoji, style=_EMOJI_STYLE),
+                    html.Span(persona_name, style=_NAME_STYLE),
+                ], style=_PENDING_HEADER_STYLE),
+                html.Div("⏳ Processing...", style=_PENDING_TEXT_STYLE)
             ],
-            style={
-                "padding": "16px",
-                "marginBottom": "12px",
-                "borderRadius": "8px",
-                "border": "2px solid #e5e7eb",
-                "backgroundColor": "#f9fafb"
-            }
+            style=_PENDING_CARD_STYLE
         )
     
-    score = persona_data.get("score", 0)
-    opinion = persona_data.get("opinion", "No opinion")
-    rationale = persona_data.get("rationale", "")
-    confidence = persona_data.get("confidence", 0)
-    note = persona_data.get("note", "")
-    
+    card_key = (
+        persona_name,
+        emoji,
+        persona_data.get("score", 0),
+        persona_data.get("opinion", "No opinion"),
+        persona_data.get("rationale", ""),
+        persona_data.get("confidence", 0),
+        persona_data.get("note", "")
+    )
+    try:
+        return _render_persona_cached(*card_key)
+    except TypeError:
+        # Unhashable field values (e.g. a list opinion) skip the memo
+        return _render_persona_cached.__wrapped__(*card_key)
+
+
+# Segments often carry identical persona results (pre-cached scores, re-renders of
+# the same segment while scrubbing), so each unique card is built once and reused;
+# Dash serializes the shared tree without mutating it. typed=True keeps 4 and 4.0
+# apart since they render different badge text
+@lru_cache(maxsize=512, typed=True)
+def _render_persona_cached(persona_name, emoji, score, opinion, rationale, confidence, note):
+    """Build a scored persona card from its field values (memoized)."""
     score_color = get_score_color(score)
+    score_str = f"{score}/5"
+    conf_pct = confidence * 100
     
-    return html.Div(
-        [
-            # Header with emoji, name, and score badge
-            html.Div([
-                html.Div([
-                    html.Span(emoji, style={"fontSize": "24px", "marginRight": "8px"}),
-                    html.Span(persona_name, style={"fontWeight": "bold", "fontSize": "16px"}),
-                ], style={"display": "inline-block"}),
-                html.Div(
-                    f"{score}/5",
-                    style={
-                        "display": "inline-block",
-                        "float": "right",
-                        "backgroundColor": score_color,
-                        "color": "white",
-                        "padding": "4px 12px",
-                        "borderRadius": "16px",
-                        "fontWeight": "bold",
-                        "fontSize": "14px"
-                    }
-                )
-            ], style={"marginBottom": "12px"}),
-            
-            # Opinion
-            html.Div([
-                html.Strong("💭 Opinion: "),
-                html.Span(opinion, style={"color": "#374151"})
-            ], style={"marginBottom": "8px", "fontSize": "14px"}),
-            
-            # Rationale
-            html.Div([
-                html.Strong("📝 Rationale: "),
-                html.Span(rationale, style={"color": "#6b7280", "fontSize": "13px"})
-            ], style={"marginBottom": "8px"}),
-            
-            # Confidence bar
-            html.Div([
-                html.Strong("🎯 Confidence: ", style={"fontSize": "13px"}),
-                html.Div(
-                    style={
-                        "height": "8px",
-                        "backgroundColor": "#e5e7eb",
-                        "borderRadius": "4px",
-                        "marginTop": "4px",
-                        "overflow": "hidden"
-                    },
-                    children=[
-                        html.Div(
-                            style={
-                                "height": "100%",
-                                "width": f"{confidence * 100}%",
-                                "backgroundColor": score_color,
-                                "transition": "width 0.3s ease"
-                            }
-                        )
-                    ]
-                ),
-                html.Span(f"{int(confidence * 100)}%", style={
-                    "fontSize": "12px",
-                    "color": "#6b7280",
-                    "marginTop": "2px",
-                    "display": "block"
-                })
-            ], style={"marginBottom": "8px"}),
-            
-            # Note (if exists)
+    children = [
+        # Header with emoji, name, and score badge
+        html.Div([
             html.Div([
-                html.Strong("📌 Note: "),
-                html.Span(note, style={"color": "#6b7280", "fontSize": "12px", "fontStyle": "italic"})
-            ], style={"marginTop": "8px"}) if note and note != "None" else None
-        ],
-        style={
-            "padding": "16px",
-            "marginBottom": "12px",
-            "borderRadius": "8px",
-            "border": f"2px solid {score_color}",
-            "backgroundColor": "#ffffff",
-            "boxShadow": "0 1px 3px rgba(0,0,0,0.1)"
-        }
-    )
+                html.Span(emoji, style=_EMOJI_STYLE),
+                html.Span(persona_name, style=_NAME_STYLE),
+            ], style=_INLINE_BLOCK_STYLE),
+            html.Div(
+                score_str,
+                style=_BADGE_STYLE_BY_COLOR[score_color]
+            )
+        ], style=_CARD_HEADER_STYLE),
+        
+        # Opinion
+        html.Div([
+            html.Strong("💭 Opinion: "),
+            html.Span(opinion, style=_OPINION_STYLE)
+        ], style=_OPINION_ROW_STYLE),
+        
+        # Rationale
+        html.Div([
+            html.Strong("📝 Rationale: "),
+            html.Span(rationale, style=_RATIONALE_STYLE)
+        ], style=_ROW_STYLE),
+        
+        # Confidence bar
+        html.Div([
+            html.Strong("🎯 Confidence: ", style=_CONFIDENCE_LABEL_STYLE),
+            html.Div(
+                style=_CONFIDENCE_TRACK_STYLE,
+                children=[
+                    html.Div(
+                        style={
+                            "height": "100%",
+                            "width": f"{conf_pct}%",
+                            "backgroundColor": score_color,
+                            "transition": "width 0.3s ease"
+                        }
+                    )
+                ]
+            ),
+            html.Span(f"{int(conf_pct)}%", style=_CONFIDENCE_TEXT_STYLE)
+        ], style=_ROW_STYLE)
+    ]
+    
+    # Note (if exists)
+    if note and note != "None":
+        children.append(html.Div([
+            html.Strong("📌 Note: "),
+            html.Span(note, style=_CARD_NOTE_STYLE)
+        ], style=_CARD_NOTE_ROW_STYLE))
+    
+    return html.Div(children, style=_CARD_STYLE_BY_COLOR[score_color])
+
+
+# (card name, emoji, segment key) per registered persona, plus the persona list they were
+# built from; personas_config reloads return a new list, which triggers a rebuild
+_PERSONA_ROWS = {"source": None, "rows": ()}
+
+
+def _persona_rows(personas):
+    """Return the (name, emoji, key) tuples for personas, rebuilding them only when the list changes."""
+    if _PERSONA_ROWS["source"] is not personas:
+        _PERSONA_ROWS["rows"] = tuple(
+            (f"{persona['emoji']} {persona['display_name']}", persona["emoji"], persona["id"])
+            for persona in personas
+        )
+        _PERSONA_ROWS["source"] = personas
+    return _PERSONA_ROWS["rows"]
+
+
+def _is_instrumental(transcript):
+    """True when the transcript is under 20 characters once surrounding whitespace is trimmed."""
+    if len(transcript) < 20:
+        return True
+    # Only copy the (possibly long) transcript via strip() when there is whitespace to trim
+    if not (transcript[0].isspace() or transcript[-1].isspace()):
+        return False
+    return len(transcript.strip()) < 20
 
 
 def render_metadata_panel(segment):
@@ -157,12 +272,7 @@ def render_metadata_panel(segment):
     if segment is None:
         return html.Div(
             "🎵 No segment selected - click on the waveform or wait for playback",
-            style={
-                "padding": "20px",
-                "textAlign": "center",
-                "color": "#6b7280",
-                "fontStyle": "italic"
-            }
+            style=_EMPTY_PANEL_STYLE
         )
     
     # Extract data with defaults
@@ -172,82 +282,49 @@ def render_metadata_panel(segment):
     note = segment.get("note", "")
     
     # Check if segment is instrumental/music only (very short or empty transcript)
-    is_instrumental = len(transcript.strip()) < 20
-    if is_instrumental and not note:
+    if _is_instrumental(transcript) and not note:
         note = "🎵 Instrumental/Music section"
     
-    return html.Div([
+    children = [
         # Segment header
         html.Div([
-            html.H3("📊 Segment Analysis", style={"marginBottom": "8px", "color": "#111827"}),
+            html.H3("📊 Segment Analysis", style=_PANEL_TITLE_STYLE),
             html.Div([
-                html.Span("📂 ", style={"marginRight": "4px"}),
+                html.Span("📂 ", style=_TAG_ICON_STYLE),
                 html.Strong("Topic: "),
-                html.Span(topic, style={
-                    "backgroundColor": "#dbeafe",
-                    "padding": "2px 8px",
-                    "borderRadius": "4px",
-                    "fontSize": "13px",
-                    "marginRight": "12px"
-                }),
-                html.Span("🎭 ", style={"marginRight": "4px"}),
+                html.Span(topic, style=_TOPIC_TAG_STYLE),
+                html.Span("🎭 ", style=_TAG_ICON_STYLE),
                 html.Strong("Tone: "),
-                html.Span(tone, style={
-                    "backgroundColor": "#fef3c7",
-                    "padding": "2px 8px",
-                    "borderRadius": "4px",
-                    "fontSize": "13px"
-                })
-            ], style={"marginBottom": "12px"})
-        ], style={"marginBottom": "16px"}),
+                html.Span(tone, style=_TONE_TAG_STYLE)
+            ], style=_TAGS_ROW_STYLE)
+        ], style=_SEGMENT_HEADER_STYLE),
         
         # Transcript
         html.Div([
-            html.Strong("📝 Transcript:", style={"display": "block", "marginBottom": "8px"}),
+            html.Strong("📝 Transcript:", style=_TRANSCRIPT_LABEL_STYLE),
             html.Div(
                 transcript,
-                style={
-                    "padding": "12px",
-                    "backgroundColor": "#f9fafb",
-                    "borderRadius": "6px",
-                    "fontSize": "14px",
-                    "lineHeight": "1.6",
-                    "color": "#374151",
-                    "border": "1px solid #e5e7eb",
-                    "maxHeight": "120px",
-                    "overflowY": "auto"
-                }
+                style=_TRANSCRIPT_STYLE
             )
-        ], style={"marginBottom": "20px"}),
+        ], style=_TRANSCRIPT_BLOCK_STYLE),
         
         # Persona evaluations - dynamically render all registered personas
         html.Div([
-            html.H4("🎯 Persona Evaluations", style={"marginBottom": "12px", "color": "#111827"}),
+            html.H4("🎯 Persona Evaluations", style=_PERSONAS_TITLE_STYLE),
             *[
-                render_persona_card(
-                    f"{persona['emoji']} {persona['display_name']}", 
-                    segment.get(persona['id']),
-                    persona['emoji']
-                )
-                for persona in get_all_personas()
+                render_persona_card(name, segment.get(key), emoji)
+                for name, emoji, key in _persona_rows(get_all_personas())
             ]
-        ]),
-        
-        # Additional note
-        html.Div([
+        ])
+    ]
+    
+    # Additional note
+    if note:
+        children.append(html.Div([
             html.Div(
                 [html.Strong("⚠️ "), note],
-                style={
-                    "padding": "8px 12px",
-                    "backgroundColor": "#fef3c7",
-                    "borderRadius": "6px",
-                    "fontSize": "13px",
-                    "border": "1px solid #fbbf24"
-                }
+                style=_NOTE_STYLE
             )
-        ], style={"marginTop": "12px"}) if note else None
-    ], style={
-        "padding": "20px",
-        "height": "100%",
-        "overflowY": "auto"
-    })
+        ], style=_NOTE_BLOCK_STYLE))
+    
+    return html.Div(children, style=_PANEL_STYLE)
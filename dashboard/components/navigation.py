@@ -1,50 +1,51 @@
 """Navigation menu component for dashboard."""
 from dash import html, dcc
 
-def render_navigation(current_page="/"):
-    """
-    Render navigation menu in top-right corner.
-    
-    Args:
-        current_page: Current page path (/files, /dashboard, /admin)
-    """
+_LINK_STYLE = {
+    "padding": "8px 16px",
+    "borderRadius": "6px",
+    "textDecoration": "none",
+    "fontWeight": "500",
+    "fontSize": "14px",
+    "transition": "all 0.2s"
+}
+_ACTIVE_LINK_COLORS = {"color": "#ffffff", "backgroundColor": "#3b82f6"}
+_INACTIVE_LINK_COLORS = {"color": "#374151", "backgroundColor": "transparent"}
+_LINKS_STYLE = {"display": "flex", "gap": "4px"}
+_NAV_STYLE = {"position": "absolute", "top": "20px", "right": "20px"}
+
+
+def _link_style(active, **extra):
+    return {**_LINK_STYLE, **extra, **(_ACTIVE_LINK_COLORS if active else _INACTIVE_LINK_COLORS)}
+
+
+def _build_nav(current_page):
+    """Build the navigation tree with the link for current_page highlighted."""
     return html.Div([
         html.Div([
             dcc.Link(
                 "📁 Files",
                 href="/files",
-                style={
-                    "padding": "8px 16px",
-                    "marginRight": "8px",
-                    "borderRadius": "6px",
-                    "textDecoration": "none",
-                    "color": "#ffffff" if current_page == "/files" else "#374151",
-                    "backgroundColor": "#3b82f6" if current_page == "/files" else "transparent",
-                    "fontWeight": "500",
-                    "fontSize": "14px",
-                    "transition": "all 0.2s"
-                }
+                style=_link_style(current_page == "/files", marginRight="8px")
             ),
             dcc.Link(
                 "⚙️ Admin",
                 href="/admin",
-                style={
-                    "padding": "8px 16px",
-                    "borderRadius": "6px",
-                    "textDecoration": "none",
-                    "color": "#ffffff" if current_page == "/admin" else "#374151",
-                    "backgroundColor": "#3b82f6" if current_page == "/admin" else "transparent",
-                    "fontWeight": "500",
-                    "fontSize": "14px",
-                    "transition": "all 0.2s"
-                }
+                style=_link_style(current_page == "/admin")
             )
-        ], style={
-            "display": "flex",
-            "gap": "4px"
-        })
-    ], style={
-        "position": "absolute",
-        "top": "20px",
-        "right": "20px"
-    })
+        ], style=_LINKS_STYLE)
+    ], style=_NAV_STYLE)
+
+
+# Only /files and /admin change the highlighting; every other page renders the "/" tree
+_NAV_CACHE = {page: _build_nav(page) for page in ("/files", "/admin", "/")}
+
+
+def render_navigation(current_page="/"):
+    """
+    Render navigation menu in top-right corner.
+    
+    Args:
+        current_page: Current page path (/files, /dashboard, /admin)
+    """
+    return _NAV_CACHE.get(current_page, _NAV_CACHE["/"])
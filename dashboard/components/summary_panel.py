@@ -6,8 +6,24 @@ This module provides functions for rendering persona summaries in different cont
 - Detailed summary tab view (Phase 4)
 """
 
-from dash import html, dcc
-import plotly.graph_objects as go
+import functools
+import math
+import threading
+from collections import OrderedDict
+from urllib.parse import quote
+from dash import html
+
+
+# Color per whole-score band: [0, 2) red, [2, 3) orange, [3, 4) blue, [4, 5] green.
+# The thresholds fall on integers, so int(score) indexes the band directly.
+_SCORE_COLOR_LUT = (
+    "#ef4444",  # Red - Low
+    "#ef4444",  # Red - Low
+    "#f59e0b",  # Orange - Moderate
+    "#3b82f6",  # Blue - Good
+    "#10b981",  # Green - Excellent
+)
+_NO_SCORE_COLOR = "#6b7280"  # Gray - NaN/inf averages have no band
 
 
 def get_score_color(score: float) -> str:
@@ -20,59 +36,107 @@ def get_score_color(score: float) -> str:
     Returns:
         Hex color code as string
     """
-    if score >= 4.0:
-        return "#10b981"  # Green - Excellent
-    elif score >= 3.0:
-        return "#3b82f6"  # Blue - Good
-    elif score >= 2.0:
-        return "#f59e0b"  # Orange - Moderate
-    else:
-        return "#ef4444"  # Red - Low
+    if not math.isfinite(score):
+        return _NO_SCORE_COLOR
+    return _SCORE_COLOR_LUT[min(4, max(0, int(score)))]
+
 
+# score_distribution keys in bar order, as constants so count extraction skips str(i)
+_SCORE_KEYS = ("1", "2", "3", "4", "5")
 
-def create_distribution_bar(score_distribution: dict, height: int = 120) -> go.Figure:
+
+# Distribution chart bars; monochromatic slate colors - minimal design
+_DISTRIBUTION_LABELS = ("1★", "2★", "3★", "4★", "5★")
+_DISTRIBUTION_COLORS = ('#cbd5e1', '#cbd5e1', '#94a3b8', '#64748b', '#0f172a')
+_DISTRIBUTION_SVG_WIDTH = 400
+
+
+def distribution_svg_src(score_distribution: dict, height: int = 120) -> str:
     """
-    Create a minimal horizontal bar chart for score distribution.
+    Render the score distribution as a static SVG bar chart.
+    
+    Drawn as an image the browser renders directly, with no plotly.js figure to lay
+    out per card.
     
     Args:
         score_distribution: Dict mapping score (1-5) to count
-                           Example: {"1": 2, "2": 5, "3": 8, "4": 3, "5": 0}
-        height: Chart height in pixels (default: 120 for compact design)
+        height: Chart height in pixels at the native 400px width
         
     Returns:
-        Plotly figure object
+        data: URI for an html.Img src
     """
-    scores = ["1★", "2★", "3★", "4★", "5★"]
-    counts = [score_distribution.get(str(i), 0) for i in range(1, 6)]
-    
-    # Monochromatic slate colors - minimal design
-    colors = ['#cbd5e1', '#cbd5e1', '#94a3b8', '#64748b', '#0f172a']
+    counts = tuple(score_distribution.get(key, 0) for key in _SCORE_KEYS)
+    return _build_distribution_svg(counts, height)
+
+
+@functools.lru_cache(maxsize=256)
+def _build_distribution_svg(counts: tuple, height: int) -> str:
+    # Plot area margins (l=20, r=20, t=10, b=30) keep the former Plotly chart's
+    # proportions; bars leave 14px headroom for the count label drawn above them
+    left, right, top, bottom = 20, 20, 10, 30
+    slot = (_DISTRIBUTION_SVG_WIDTH - left - right) / 5
+    bar_width = slot * 0.8
+    baseline = height - bottom
+    max_bar = baseline - top - 14
+    peak = max(counts) or 1
     
-    fig = go.Figure(data=[
-        go.Bar(
-            x=scores,
-            y=counts,
-            marker_color=colors,
-            text=counts,
-            textposition='outside',
-            textfont=dict(size=11, color='#64748b')
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {_DISTRIBUTION_SVG_WIDTH} {height}" '
+        f'font-family="sans-serif" font-size="11" fill="#64748b" text-anchor="middle">'
+    ]
+    for i, (count, label, color) in enumerate(zip(counts, _DISTRIBUTION_LABELS, _DISTRIBUTION_COLORS)):
+        center = left + slot * (i + 0.5)
+        bar_height = count / peak * max_bar
+        parts.append(
+            f'<rect x="{center - bar_width / 2:.1f}" y="{baseline - bar_height:.1f}" '
+            f'width="{bar_width:.1f}" height="{bar_height:.1f}" fill="{color}"/>'
+            f'<text x="{center:.1f}" y="{baseline - bar_height - 4:.1f}">{count}</text>'
+            f'<text x="{center:.1f}" y="{baseline + 16}">{label}</text>'
         )
-    ])
-    
-    fig.update_layout(
-        title=None,
-        xaxis_title=None,
-        yaxis_title=None,
-        height=height,
-        margin=dict(l=20, r=20, t=10, b=30),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        xaxis=dict(showgrid=False, showline=False),
-        yaxis=dict(showgrid=False, showline=False, showticklabels=False),
-        font=dict(size=11, color='#64748b')
-    )
-    
-    return fig
+    parts.append('</svg>')
+    return "data:image/svg+xml;utf8," + quote("".join(parts))
+
+
+# Static compact card styles, shared by every card; only the score-colored and
+# confidence-width styles are built per card (by merging one value into a base dict)
+_COMPACT_EMOJI_STYLE = {"fontSize": "32px", "textAlign": "center", "marginBottom": "8px"}
+_COMPACT_NAME_STYLE = {
+    "fontSize": "13px",
+    "fontWeight": "600",
+    "color": "#111827",
+    "textAlign": "center",
+    "marginBottom": "12px"
+}
+_COMPACT_SCORE_BASE_STYLE = {"fontSize": "36px", "fontWeight": "700", "lineHeight": "1"}
+_COMPACT_SCORE_SUFFIX_STYLE = {"fontSize": "14px", "color": "#9ca3af", "marginLeft": "4px"}
+_COMPACT_SCORE_ROW_STYLE = {"textAlign": "center", "marginBottom": "12px"}
+# Track and fill are one element: the fill is a hard-stop gradient over the track color
+_COMPACT_CONFIDENCE_BAR_BASE_STYLE = {"width": "100%", "height": "4px", "borderRadius": "2px"}
+_COMPACT_CONFIDENCE_TEXT_STYLE = {"fontSize": "10px", "color": "#6b7280", "marginTop": "6px", "textAlign": "center"}
+_COMPACT_CARD_BASE_STYLE = {
+    "padding": "16px",
+    "backgroundColor": "#ffffff",
+    "borderRadius": "8px",
+    "boxShadow": "0 2px 4px rgba(0,0,0,0.06)",
+    "transition": "transform 0.2s ease, box-shadow 0.2s ease",
+    "textAlign": "center"
+}
+
+# The detailed (full) card is styled entirely by classes from assets/style.css
+# ("Summary tab persona cards"), so its layout JSON carries class names only
+
+
+def _segment_pills(segments) -> list:
+    """One "#N" pill per segment id."""
+    return [html.Span(f"#{seg}", className="summary-card-pill") for seg in segments]
+
+
+# Rendered cards keyed by everything they display (persona fields + stats fingerprint);
+# unchanged personas re-render from here when other parts of the summary change. The
+# lock guards the OrderedDict against concurrent callbacks under threaded workers
+_CARD_CACHE_SIZE = 512
+_CARD_CACHE = OrderedDict()
+_CARD_CACHE_LOCK = threading.Lock()
 
 
 def render_persona_summary_card(persona: dict, stats: dict, compact: bool = False) -> html.Div:
@@ -85,253 +149,199 @@ def render_persona_summary_card(persona: dict, stats: dict, compact: bool = Fals
         compact: If True, render smaller version for collapsible panel
         
     Returns:
-        Dash Div component containing the persona card
+        Dash Div component containing the persona card (shared between calls; do not mutate)
     """
-    avg_score = stats.get("avg_score", 0)
-    avg_confidence = stats.get("avg_confidence", 0)
+    # Read every displayed stats field once; the same values form the cache key and
+    # feed the builder, so neither walks the stats dict again
     score_dist = stats.get("score_distribution", {})
-    top_segments = stats.get("top_segments", [])
-    worst_segments = stats.get("worst_segments", [])
+    fields = (
+        stats.get("avg_score", 0),
+        stats.get("avg_confidence", 0),
+        tuple(score_dist.get(key, 0) for key in _SCORE_KEYS),
+        tuple(stats.get("top_segments", [])),
+        tuple(stats.get("worst_segments", []))
+    )
+    try:
+        key = (compact, persona["id"], persona["emoji"], persona["display_name"], persona.get("description"), *fields)
+        hash(key)
+    except TypeError:
+        # Unhashable stats values skip the cache
+        return _build_persona_summary_card(persona, fields, compact)
+    
+    with _CARD_CACHE_LOCK:
+        card = _CARD_CACHE.get(key)
+        if card is not None:
+            _CARD_CACHE.move_to_end(key)
+            return card
+    
+    card = _build_persona_summary_card(persona, fields, compact)
+    with _CARD_CACHE_LOCK:
+        _CARD_CACHE[key] = card
+        _CARD_CACHE.move_to_end(key)
+        if len(_CARD_CACHE) > _CARD_CACHE_SIZE:
+            _CARD_CACHE.popitem(last=False)
+    
+    return card
+
+
+def _build_persona_summary_card(persona: dict, fields: tuple, compact: bool) -> html.Div:
+    """
+    Build a persona summary card (uncached; see render_persona_summary_card).
+    
+    Args:
+        persona: Persona config dict
+        fields: (avg_score, avg_confidence, distribution counts for scores 1-5,
+            top_segments, worst_segments) as extracted by render_persona_summary_card
+        compact: If True, render smaller version for collapsible panel
+    """
+    avg_score, avg_confidence, counts, top_segments, worst_segments = fields
+    
+    # Both layouts show the score to one decimal and the confidence as a whole percent
+    score_str = f"{avg_score:.1f}"
+    confidence_pct = avg_confidence * 100
+    confidence_str = f"{confidence_pct:.0f}%"
     
     if compact:
         # Compact version for collapsible panel - card-style with larger score
+        score_color = get_score_color(avg_score)
         return html.Div([
             # Emoji at top
-            html.Div(
-                persona["emoji"],
-                style={
-                    "fontSize": "32px",
-                    "textAlign": "center",
-                    "marginBottom": "8px"
-                }
-            ),
+            html.Div(persona["emoji"], style=_COMPACT_EMOJI_STYLE),
             
             # Persona name
-            html.Div(
-                persona["display_name"],
-                style={
-                    "fontSize": "13px",
-                    "fontWeight": "600",
-                    "color": "#111827",
-                    "textAlign": "center",
-                    "marginBottom": "12px"
-                }
-            ),
+            html.Div(persona["display_name"], style=_COMPACT_NAME_STYLE),
             
             # Large score display
             html.Div([
-                html.Span(f"{avg_score:.1f}", style={
-                    "fontSize": "36px",
-                    "fontWeight": "700",
-                    "color": get_score_color(avg_score),
-                    "lineHeight": "1"
+                html.Span(score_str, style={
+                    **_COMPACT_SCORE_BASE_STYLE,
+                    "color": score_color
                 }),
-                html.Span("/5.0", style={
-                    "fontSize": "14px",
-                    "color": "#9ca3af",
-                    "marginLeft": "4px"
-                })
-            ], style={
-                "textAlign": "center",
-                "marginBottom": "12px"
-            }),
+                html.Span("/5.0", style=_COMPACT_SCORE_SUFFIX_STYLE)
+            ], style=_COMPACT_SCORE_ROW_STYLE),
             
             # Confidence bar
             html.Div([
                 html.Div(style={
-                    "width": "100%",
-                    "height": "4px",
-                    "backgroundColor": "#e5e7eb",
-                    "borderRadius": "2px",
-                    "overflow": "hidden"
-                }, children=[
-                    html.Div(style={
-                        "width": f"{avg_confidence * 100}%",
-                        "height": "100%",
-                        "backgroundColor": get_score_color(avg_score),
-                        "borderRadius": "2px",
-                        "transition": "width 0.5s ease"
-                    })
-                ]),
-                html.Div(f"{avg_confidence*100:.0f}% confidence", style={
-                    "fontSize": "10px",
-                    "color": "#6b7280",
-                    "marginTop": "6px",
-                    "textAlign": "center"
-                })
+                    **_COMPACT_CONFIDENCE_BAR_BASE_STYLE,
+                    "background": f"linear-gradient(to right, {score_color} {confidence_pct}%, #e5e7eb {confidence_pct}%)"
+                }),
+                html.Div(f"{confidence_str} confidence", style=_COMPACT_CONFIDENCE_TEXT_STYLE)
             ])
             
         ], style={
-            "padding": "16px",
-            "backgroundColor": "#ffffff",
-            "borderRadius": "8px",
-            "border": f"2px solid {get_score_color(avg_score)}",
-            "boxShadow": "0 2px 4px rgba(0,0,0,0.06)",
-            "transition": "transform 0.2s ease, box-shadow 0.2s ease",
-            "textAlign": "center"
+            **_COMPACT_CARD_BASE_STYLE,
+            "border": f"2px solid {score_color}"
         })
     else:
-        # Full version for detailed summary tab - MINIMAL DESIGN
+        # Full version for detailed summary tab - MINIMAL DESIGN. The card is a
+        # two-column CSS grid (assets/style.css), so metrics, chart and segment lists
+        # are direct children instead of sitting in per-row wrapper Divs
         return html.Div([
-            # Minimal header with persona info
+            # Minimal header with persona info (emoji spans the name/description rows)
             html.Div([
-                html.Span(persona["emoji"], style={
-                    "fontSize": "20px",
-                    "marginRight": "10px"
-                }),
-                html.Div([
-                    html.H3(persona["display_name"], style={
-                        "margin": "0",
-                        "fontSize": "15px",
-                        "fontWeight": "500",
-                        "color": "#0f172a"
-                    }),
-                    html.P(persona["description"], style={
-                        "margin": "2px 0 0 0",
-                        "fontSize": "12px",
-                        "color": "#94a3b8"
-                    })
-                ], style={"flex": "1"})
-            ], style={
-                "display": "flex",
-                "alignItems": "center",
-                "marginBottom": "16px",
-                "paddingBottom": "12px",
-                "borderBottom": "1px solid #f1f5f9"
-            }),
+                html.Span(persona["emoji"], className="summary-card-emoji"),
+                html.H3(persona["display_name"], className="summary-card-name"),
+                html.P(persona["description"], className="summary-card-description")
+            ], className="summary-card-header"),
             
-            # Compact metrics row
+            # Average score | Confidence
             html.Div([
-                # Average score
-                html.Div([
-                    html.Div("Avg Score", style={
-                        "fontSize": "11px",
-                        "color": "#94a3b8",
-                        "marginBottom": "4px",
-                        "textTransform": "uppercase",
-                        "letterSpacing": "0.05em"
-                    }),
-                    html.Div(f"{avg_score:.1f}", style={
-                        "fontSize": "28px",
-                        "fontWeight": "500",
-                        "color": "#0f172a",
-                        "lineHeight": "1"
-                    }),
-                    html.Div("/ 5.0", style={
-                        "fontSize": "12px",
-                        "color": "#cbd5e1",
-                        "marginTop": "2px"
-                    })
-                ], style={
-                    "flex": "1",
-                    "marginRight": "12px"
-                }),
-                
-                # Confidence
-                html.Div([
-                    html.Div("Confidence", style={
-                        "fontSize": "11px",
-                        "color": "#94a3b8",
-                        "marginBottom": "4px",
-                        "textTransform": "uppercase",
-                        "letterSpacing": "0.05em"
-                    }),
-                    html.Div(f"{avg_confidence*100:.0f}%", style={
-                        "fontSize": "28px",
-                        "fontWeight": "500",
-                        "color": "#0f172a",
-                        "lineHeight": "1"
-                    })
-                ], style={
-                    "flex": "1"
-                })
-            ], style={
-                "display": "flex",
-                "marginBottom": "16px"
-            }),
-            
-            # Compact score distribution chart
+                html.Div("Avg Score", className="summary-card-label"),
+                html.Div(score_str, className="summary-card-metric"),
+                html.Div("/ 5.0", className="summary-card-metric-suffix")
+            ], className="summary-card-section"),
             html.Div([
-                html.Div("Score Distribution", style={
-                    "fontSize": "11px",
-                    "color": "#94a3b8",
-                    "marginBottom": "8px",
-                    "textTransform": "uppercase",
-                    "letterSpacing": "0.05em"
-                }),
-                dcc.Graph(
-                    figure=create_distribution_bar(score_dist, height=120),
-                    config={'displayModeBar': False},
-                    style={"margin": "0 -12px"}
-                )
-            ], style={"marginBottom": "16px"}),
+                html.Div("Confidence", className="summary-card-label"),
+                html.Div(confidence_str, className="summary-card-metric")
+            ], className="summary-card-section"),
             
-            # Minimal top & worst segments
-            html.Div([
-                # Top segments
-                html.Div([
-                    html.Div("Top Segments", style={
-                        "fontSize": "11px",
-                        "color": "#94a3b8",
-                        "marginBottom": "6px",
-                        "textTransform": "uppercase",
-                        "letterSpacing": "0.05em"
-                    }),
-                    html.Div([
-                        html.Span(f"#{seg}", style={
-                            "display": "inline-block",
-                            "padding": "3px 8px",
-                            "marginRight": "4px",
-                            "marginBottom": "4px",
-                            "backgroundColor": "#f8fafc",
-                            "color": "#64748b",
-                            "fontSize": "11px",
-                            "fontWeight": "500",
-                            "border": "1px solid #f1f5f9"
-                        }) for seg in top_segments
-                    ])
-                ], style={
-                    "flex": "1",
-                    "marginRight": "12px"
-                }),
-                
-                # Worst segments
-                html.Div([
-                    html.Div("Worst Segments", style={
-                        "fontSize": "11px",
-                        "color": "#94a3b8",
-                        "marginBottom": "6px",
-                        "textTransform": "uppercase",
-                        "letterSpacing": "0.05em"
-                    }),
-                    html.Div([
-                        html.Span(f"#{seg}", style={
-                            "display": "inline-block",
-                            "padding": "3px 8px",
-                            "marginRight": "4px",
-                            "marginBottom": "4px",
-                            "backgroundColor": "#f8fafc",
-                            "color": "#64748b",
-                            "fontSize": "11px",
-                            "fontWeight": "500",
-                            "border": "1px solid #f1f5f9"
-                        }) for seg in worst_segments
-                    ])
-                ], style={
-                    "flex": "1"
-                })
-            ], style={
-                "display": "flex"
-            })
+            # Compact score distribution chart, full width
+            html.Div("Score Distribution", className="summary-card-label summary-card-label-chart summary-card-wide"),
+            html.Img(
+                src=_build_distribution_svg(counts, 120),
+                alt="Score distribution",
+                className="summary-card-distribution summary-card-wide summary-card-section"
+            ),
             
-        ], style={
-            "backgroundColor": "#ffffff",
-            "borderRadius": "0",
-            "padding": "20px",
-            "marginBottom": "12px",
-            "border": "1px solid #f1f5f9",
-            "boxShadow": "none"
-        })
+            # Top segments | Worst segments
+            html.Div([
+                html.Div("Top Segments", className="summary-card-label summary-card-label-pills"),
+                *_segment_pills(top_segments)
+            ]),
+            html.Div([
+                html.Div("Worst Segments", className="summary-card-label summary-card-label-pills"),
+                *_segment_pills(worst_segments)
+            ])
+        ], className="summary-card")
+
+
+# Panel-level styles for the collapsible and detailed views; the expanded/collapsed
+# variants are built once each so render_collapsible_summary only picks one
+_COLLAPSIBLE_EMPTY_STYLE = {"padding": "16px", "color": "#6b7280", "fontStyle": "italic"}
+_COLLAPSIBLE_PANEL_STYLE = {"marginBottom": "16px"}
+_TOGGLE_ARROW_STYLE = {"marginRight": "8px"}
+_TOGGLE_TITLE_STYLE = {"fontWeight": "600"}
+_TOGGLE_STYLE_BY_EXPANDED = {
+    expanded: {
+        "width": "100%",
+        "padding": "12px 16px",
+        "backgroundColor": "#f3f4f6",
+        "border": "none",
+        "borderRadius": "8px 8px 0 0" if expanded else "8px",
+        "cursor": "pointer",
+        "fontSize": "14px",
+        "color": "#111827",
+        "textAlign": "left",
+        "transition": "background-color 0.2s",
+    }
+    for expanded in (True, False)
+}
+_CONTENT_STYLE_BY_EXPANDED = {
+    expanded: {
+        "padding": "16px",
+        "backgroundColor": "#ffffff",
+        "borderRadius": "0 0 8px 8px",
+        "border": "1px solid #e5e7eb",
+        "borderTop": "none",
+        "display": "grid" if expanded else "none",
+        "gridTemplateColumns": "repeat(auto-fit, minmax(220px, 1fr))",
+        "gap": "12px"
+    }
+    for expanded in (True, False)
+}
+
+_DETAILED_EMPTY_STYLE = {"padding": "40px", "color": "#6b7280", "textAlign": "center", "fontSize": "16px"}
+_DETAILED_AUDIO_STYLE = {
+    "margin": "0 0 4px 0",
+    "fontSize": "13px",
+    "color": "#94a3b8",
+    "textTransform": "uppercase",
+    "letterSpacing": "0.05em"
+}
+_DETAILED_SEGMENTS_STYLE = {"margin": "0", "fontSize": "15px", "fontWeight": "500", "color": "#0f172a"}
+_DETAILED_HEADER_STYLE = {"marginBottom": "24px", "paddingBottom": "16px", "borderBottom": "1px solid #f1f5f9"}
+_DETAILED_GRID_STYLE = {
+    "display": "grid",
+    "gridTemplateColumns": "repeat(auto-fit, minmax(400px, 1fr))",
+    "gap": "16px"
+}
+
+
+def _has_scores(stats: dict) -> bool:
+    """True when stats cover at least one scored segment (the aggregator zero-fills personas without feedback)."""
+    return bool(stats.get("avg_score") or any(stats.get("score_distribution", {}).values()))
+
+
+def _render_empty_summary_card(persona: dict) -> html.Div:
+    """Render the lightweight placeholder shown in the detailed view for a persona with no scored segments."""
+    return html.Div([
+        html.Div([
+            html.Span(persona["emoji"], className="summary-card-emoji"),
+            html.H3(persona["display_name"], className="summary-card-name")
+        ], className="summary-card-header"),
+        html.Div("No scored segments yet", className="summary-card-empty-text summary-card-wide")
+    ], className="summary-card summary-card-empty")
 
 
 def render_collapsible_summary(personas: list, summary_data: dict, is_expanded: bool = True) -> html.Div:
@@ -349,60 +359,38 @@ def render_collapsible_summary(personas: list, summary_data: dict, is_expanded:
     if not summary_data or "personas" not in summary_data:
         return html.Div(
             "Summary data not available",
-            style={"padding": "16px", "color": "#6b7280", "fontStyle": "italic"}
+            style=_COLLAPSIBLE_EMPTY_STYLE
         )
     
     personas_data = summary_data.get("personas", {})
     num_segments = summary_data.get("num_segments", 0)
     
-    # Create compact persona cards
-    persona_cards = []
-    for persona in personas:
-        persona_id = persona["id"]
-        if persona_id in personas_data:
-            stats = personas_data[persona_id]
-            card = render_persona_summary_card(persona, stats, compact=True)
-            persona_cards.append(card)
+    # Create compact persona cards (one dict lookup per persona); personas without
+    # scored segments have nothing to show and are skipped
+    get_stats = personas_data.get
+    persona_cards = [
+        render_persona_summary_card(persona, stats, compact=True)
+        for persona in personas
+        if (stats := get_stats(persona["id"])) is not None and _has_scores(stats)
+    ]
     
     return html.Div([
         # Toggle button
         html.Button([
-            html.Span("▼" if is_expanded else "▶", style={"marginRight": "8px"}),
-            html.Span(f"📊 Summary ({num_segments} segments)", style={"fontWeight": "600"})
+            html.Span("▼" if is_expanded else "▶", id="summary-collapse-arrow", style=_TOGGLE_ARROW_STYLE),
+            html.Span(f"📊 Summary ({num_segments} segments)", style=_TOGGLE_TITLE_STYLE)
         ], 
         id="summary-collapse-toggle",
         n_clicks=0,
-        style={
-            "width": "100%",
-            "padding": "12px 16px",
-            "backgroundColor": "#f3f4f6",
-            "border": "none",
-            "borderRadius": "8px 8px 0 0" if is_expanded else "8px",
-            "cursor": "pointer",
-            "fontSize": "14px",
-            "color": "#111827",
-            "textAlign": "left",
-            "transition": "background-color 0.2s",
-        }),
+        style=_TOGGLE_STYLE_BY_EXPANDED[bool(is_expanded)]),
         
         # Collapsible content
         html.Div(
             persona_cards,
             id="summary-collapse-content",
-            style={
-                "padding": "16px",
-                "backgroundColor": "#ffffff",
-                "borderRadius": "0 0 8px 8px",
-                "border": "1px solid #e5e7eb",
-                "borderTop": "none",
-                "display": "grid" if is_expanded else "none",
-                "gridTemplateColumns": "repeat(auto-fit, minmax(220px, 1fr))",
-                "gap": "12px"
-            }
+            style=_CONTENT_STYLE_BY_EXPANDED[bool(is_expanded)]
         )
-    ], style={
-        "marginBottom": "16px"
-    })
+    ], style=_COLLAPSIBLE_PANEL_STYLE)
 
 
 def render_detailed_summary(personas: list, summary_data: dict) -> html.Div:
@@ -419,49 +407,31 @@ def render_detailed_summary(personas: list, summary_data: dict) -> html.Div:
     if not summary_data or "personas" not in summary_data:
         return html.Div(
             "Select an audio file to view summary",
-            style={"padding": "40px", "color": "#6b7280", "textAlign": "center", "fontSize": "16px"}
+            style=_DETAILED_EMPTY_STYLE
         )
     
     personas_data = summary_data.get("personas", {})
     num_segments = summary_data.get("num_segments", 0)
     audio_id = summary_data.get("audio_id", "Unknown")
     
-    # Create full persona cards
-    persona_cards = []
-    for persona in personas:
-        persona_id = persona["id"]
-        if persona_id in personas_data:
-            stats = personas_data[persona_id]
-            card = render_persona_summary_card(persona, stats, compact=False)
-            persona_cards.append(card)
+    # Create full persona cards (one dict lookup per persona); personas without scored
+    # segments get a small placeholder instead of an all-zero card
+    get_stats = personas_data.get
+    persona_cards = [
+        render_persona_summary_card(persona, stats, compact=False)
+        if _has_scores(stats) else _render_empty_summary_card(persona)
+        for persona in personas
+        if (stats := get_stats(persona["id"])) is not None
+    ]
     
     # Minimal header with overview
     header = html.Div([
-        html.Div(f"Summary for Audio: {audio_id[:20]}...", style={
-            "margin": "0 0 4px 0",
-            "fontSize": "13px",
-            "color": "#94a3b8",
-            "textTransform": "uppercase",
-            "letterSpacing": "0.05em"
-        }),
-        html.Div(f"Total Segments: {num_segments}", style={
-            "margin": "0",
-            "fontSize": "15px",
-            "fontWeight": "500",
-            "color": "#0f172a"
-        })
-    ], style={
-        "marginBottom": "24px",
-        "paddingBottom": "16px",
-        "borderBottom": "1px solid #f1f5f9"
-    })
+        html.Div(f"Summary for Audio: {audio_id[:20]}...", style=_DETAILED_AUDIO_STYLE),
+        html.Div(f"Total Segments: {num_segments}", style=_DETAILED_SEGMENTS_STYLE)
+    ], style=_DETAILED_HEADER_STYLE)
     
     # Use grid layout for better information density
     return html.Div([
         header,
-        html.Div(persona_cards, style={
-            "display": "grid",
-            "gridTemplateColumns": "repeat(auto-fit, minmax(400px, 1fr))",
-            "gap": "16px"
-        })
+        html.Div(persona_cards, style=_DETAILED_GRID_STYLE)
     ])
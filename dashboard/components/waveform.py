@@ -15,7 +15,8 @@ def render_waveform_with_highlight(time, amplitude, segments, cursor_position=No
     """
     fig = go.Figure()
 
-    fig.add_trace(go.Scatter(
+    # WebGL trace keeps client-side redraws cheap during playback
+    fig.add_trace(go.Scattergl(
         x=time,
         y=amplitude,
         mode='lines',
@@ -27,36 +28,57 @@ def render_waveform_with_highlight(time, amplitude, segments, cursor_position=No
     y_min = amp_min if amp_min is not None else min(amplitude)
     y_max = amp_max if amp_max is not None else max(amplitude)
 
+    # All segment rects and the cursor go in with the layout in one call, rather than
+    # one add_shape (validation + layout merge) per segment
+    fig.update_layout(
+        shapes=waveform_shapes(segments, cursor_position, y_min, y_max),
+        title="Audio Waveform with Segment Highlight",
+        xaxis_title="Time (s)",
+        yaxis_title="Amplitude",
+        height=400,
+        margin=dict(l=40, r=40, t=40, b=40)
+    )
+
+    return fig
+
+
+def waveform_shapes(segments, cursor_position, y_min, y_max):
+    """
+    Build the segment highlight rects and the optional cursor line as shape dicts.
+    
+    Playback updates send only these (via a Patch on layout.shapes) instead of
+    re-sending the whole figure with its waveform trace.
+    
+    Args:
+        segments: List of segment dicts with start/end times
+        cursor_position: Current playback position, or None for no cursor
+        y_min: Bottom of the shapes (waveform minimum amplitude)
+        y_max: Top of the shapes (waveform maximum amplitude)
+        
+    Returns:
+        List of Plotly shape dicts, segments first and the cursor last
+    """
+    shapes = []
     for seg in segments:
         is_active = cursor_position and seg["start"] <= cursor_position <= seg["end"]
-        fill = "rgba(255, 0, 0, 0.4)" if is_active else "rgba(255, 0, 0, 0.2)"
-
-        fig.add_shape(
+        shapes.append(dict(
             type="rect",
             x0=seg["start"],
             x1=seg["end"],
             y0=y_min,
             y1=y_max,
-            fillcolor=fill,
+            fillcolor="rgba(255, 0, 0, 0.4)" if is_active else "rgba(255, 0, 0, 0.2)",
             line=dict(width=0)
-        )
+        ))
 
     if cursor_position is not None:
-        fig.add_shape(
+        shapes.append(dict(
             type="line",
             x0=cursor_position,
             x1=cursor_position,
             y0=y_min,
             y1=y_max,
             line=dict(color="blue", width=2, dash="dot")
-        )
-
-    fig.update_layout(
-        title="Audio Waveform with Segment Highlight",
-        xaxis_title="Time (s)",
-        yaxis_title="Amplitude",
-        height=400,
-        margin=dict(l=40, r=40, t=40, b=40)
-    )
+        ))
 
-    return fig
\ No newline at end of file
+    return shapes
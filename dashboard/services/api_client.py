@@ -1,4 +1,60 @@
+import logging
 import requests
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson decodes response bodies ~2x faster; both raise ValueError subclasses on bad JSON
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+
+class _RateLimitFilter(logging.Filter):
+    """Emit each message template at most once per interval; count what was dropped."""
+    
+    def __init__(self, interval: float = 5.0):
+        super().__init__()
+        self.interval = interval
+        self._last_emit = {}
+        self._suppressed = {}
+        self._lock = threading.Lock()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.levelno, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_emit.get(key, float("-inf")) < self.interval:
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                return False
+            self._last_emit[key] = now
+            suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            record.msg = f"{record.msg} (+{suppressed} similar suppressed)"
+        return True
+
+
+# Backend errors come in bursts when the API is down; log them rate-limited
+# instead of printing every failure from every callback
+logger = logging.getLogger(__name__)
+logger.addFilter(_RateLimitFilter())
+
+# Shared pooled session so dashboard calls to the backend reuse keep-alive connections
+backend_session = requests.Session()
+backend_session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=0))
+
+# Bounded pool for backend fetches that callbacks start early and collect later,
+# so the HTTP wait overlaps local work instead of serializing with it
+_FETCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="backend-fetch")
+
+# Last bundle seen per audio_id with its ETag; revalidated with If-None-Match so an
+# unchanged bundle comes back as an empty 304 instead of being re-sent and re-parsed
+_BUNDLE_CACHE_SIZE = 32
+_BUNDLE_CACHE = OrderedDict()
+_BUNDLE_CACHE_LOCK = threading.Lock()
+
 
 def fetch_segments(audio_id: str, api_base: str = "http://localhost:8000") -> list:
     """
@@ -8,19 +64,83 @@ def fetch_segments(audio_id: str, api_base: str = "http://localhost:8000") -> li
         List of segments, or empty list if not found or error occurs.
     """
     try:
-        response = requests.get(f"{api_base}/segments/{audio_id}")
+        response = backend_session.get(f"{api_base}/segments/{audio_id}", timeout=5)
         response.raise_for_status()
-        return response.json()["segments"]
+        return _loads(response.content)["segments"]
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
-            print(f"Warning: No segments found for audio ID {audio_id}")
+            logger.warning("No segments found for audio ID %s", audio_id)
             return []
         else:
-            print(f"Error fetching segments: {e}")
+            logger.warning("Error fetching segments for %s: %s", audio_id, e)
             return []
     except requests.exceptions.RequestException as e:
-        print(f"Error connecting to backend API: {e}")
+        logger.warning("Error connecting to backend API: %s", e)
         return []
     except (KeyError, ValueError) as e:
-        print(f"Error parsing segments response: {e}")
+        logger.warning("Error parsing segments response for %s: %s", audio_id, e)
         return []
+
+
+def fetch_bundle(audio_id: str, api_base: str = "http://localhost:8000") -> dict:
+    """
+    Fetch segments and summary for an audio ID in one backend round-trip.
+    
+    Returns:
+        Dict with "segments" (list, empty if missing) and "summary" (dict or None).
+    """
+    empty = {"segments": [], "summary": None}
+    with _BUNDLE_CACHE_LOCK:
+        cached = _BUNDLE_CACHE.get(audio_id)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+    
+    try:
+        response = backend_session.get(f"{api_base}/bundle/{audio_id}", headers=headers, timeout=5)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        response.raise_for_status()
+        bundle = _loads(response.content)
+        result = {"segments": bundle.get("segments") or [], "summary": bundle.get("summary")}
+        
+        etag = response.headers.get("ETag")
+        if etag:
+            with _BUNDLE_CACHE_LOCK:
+                _BUNDLE_CACHE[audio_id] = (etag, result)
+                _BUNDLE_CACHE.move_to_end(audio_id)
+                if len(_BUNDLE_CACHE) > _BUNDLE_CACHE_SIZE:
+                    _BUNDLE_CACHE.popitem(last=False)
+        return result
+    except requests.exceptions.HTTPError as e:
+        if e.response.status_code == 404:
+            logger.warning("No data found for audio ID %s", audio_id)
+        else:
+            logger.warning("Error fetching bundle for %s: %s", audio_id, e)
+        return empty
+    except requests.exceptions.RequestException as e:
+        logger.warning("Error connecting to backend API: %s", e)
+        return empty
+    except ValueError as e:
+        logger.warning("Error parsing bundle response for %s: %s", audio_id, e)
+        return empty
+
+
+def fetch_bundle_async(audio_id: str, api_base: str = "http://localhost:8000"):
+    """
+    Start fetch_bundle on the shared fetch pool.
+    
+    Returns:
+        concurrent.futures.Future resolving to the fetch_bundle() dict.
+    """
+    return _FETCH_POOL.submit(fetch_bundle, audio_id, api_base)
+
+
+def prefetch_bundles(audio_ids, api_base: str = "http://localhost:8000"):
+    """
+    Warm the bundle cache for the listed audio files in the background.
+    
+    Only the first _BUNDLE_CACHE_SIZE ids are fetched (callers pass newest first),
+    so the warm-up never evicts its own entries. Later switches to these files
+    revalidate with If-None-Match and get an empty 304 instead of the full body.
+    """
+    for audio_id in list(audio_ids)[:_BUNDLE_CACHE_SIZE]:
+        _FETCH_POOL.submit(fetch_bundle, audio_id, api_base)
@@ -133,3 +133,72 @@ def extract_waveform(audio_path):
         import traceback
         traceback.print_exc()
         return np.array([0, 1]), np.array([0, 0])
+
+
+def load_waveform(audio_path):
+    """
+    Load waveform data, memoized to disk next to the audio file.
+    
+    The first call extracts the waveform and saves it as float32 to
+    ``{stem}.waveform.npy`` (row 0 = time, row 1 = amplitude). Later calls
+    memory-map that file instead of re-decoding the audio. The cache is
+    regenerated when the audio file is newer than it.
+    
+    Args:
+        audio_path: Path to audio file
+        
+    Returns:
+        Tuple of (time_array, amplitude_array) as float32
+    """
+    audio_path = Path(audio_path)
+    cache_path = audio_path.with_name(f"{audio_path.stem}.waveform.npy")
+    
+    try:
+        if cache_path.exists() and cache_path.stat().st_mtime >= audio_path.stat().st_mtime:
+            data = np.load(cache_path, mmap_mode='r')
+            return data[0], data[1]
+    except Exception as e:
+        print(f"Warning: could not read waveform cache {cache_path}: {e}")
+    
+    time, amplitude = extract_waveform(str(audio_path))
+    data = np.vstack([time, amplitude]).astype(np.float32)
+    
+    # Only persist real extractions, not the minimal placeholder returned on error
+    if audio_path.exists() and data.shape[1] > 2:
+        try:
+            np.save(cache_path, data)
+        except OSError as e:
+            print(f"Warning: could not write waveform cache {cache_path}: {e}")
+    
+    return data[0], data[1]
+
+
+def minmax_downsample(time, amplitude, target_buckets=2000):
+    """
+    Reduce a waveform to a min/max envelope for plotting.
+    
+    Samples are grouped into roughly ``target_buckets`` equal-width buckets and
+    each bucket contributes its minimum and maximum amplitude, so peaks survive
+    downsampling. Output points are interleaved (min, max) per bucket and can
+    be drawn directly as a single line trace.
+    
+    Args:
+        time: Array of time values
+        amplitude: Array of amplitude values
+        target_buckets: Approximate number of buckets (pixel columns) to keep
+        
+    Returns:
+        Tuple of (time_array, amplitude_array) with 2 points per bucket
+    """
+    stride = len(amplitude) // target_buckets
+    if stride < 2:
+        return time, amplitude
+    
+    n_buckets = len(amplitude) // stride
+    buckets = np.asarray(amplitude[:n_buckets * stride]).reshape(n_buckets, stride)
+    envelope = np.empty((n_buckets, 2), dtype=buckets.dtype)
+    envelope[:, 0] = buckets.min(axis=1)
+    envelope[:, 1] = buckets.max(axis=1)
+    
+    bucket_times = np.asarray(time[:n_buckets * stride:stride])
+    return np.repeat(bucket_times, 2), envelope.ravel()
@@ -19,9 +19,7 @@ def get_audio_summary_mini(audio_id: str) -> dict:
             "advertiser": {"avg_score": 4.2, "emoji": "💼"}
         }
     """
-    import sys
-    from pathlib import Path
-    sys.path.insert(0, str(Path(__file__).parent.parent))
+    # Imported per call so edits reloaded via importlib.reload(personas_config) apply
     from personas_config import get_all_personas
     
     try:
@@ -0,0 +1,60 @@
+"""Helpers for locating the active segment during playback."""
+import numpy as np
+
+
+# Sorted segment start times per audio_id, for binary-search segment lookup, stored
+# with the (count, first start, last end) of the segment list they were built from
+_SEG_STARTS_CACHE = {}
+
+
+def get_segment_starts(audio_id: str, segments: list) -> np.ndarray:
+    """
+    Return a float64 array of segment start times, cached per audio_id.
+    
+    The cached array is rebuilt whenever the segment count or the outer segment
+    bounds change; callers that reload segments in place also call
+    clear_segment_starts.
+    
+    Args:
+        audio_id: Audio file identifier
+        segments: List of segment dicts sorted by start time
+        
+    Returns:
+        Array of start times aligned with segments
+    """
+    key = (len(segments), segments[0]["start"], segments[-1]["end"]) if segments else (0,)
+    cached = _SEG_STARTS_CACHE.get(audio_id)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    seg_starts = np.fromiter((s["start"] for s in segments), dtype=np.float64, count=len(segments))
+    _SEG_STARTS_CACHE[audio_id] = (key, seg_starts)
+    return seg_starts
+
+
+def clear_segment_starts(audio_id: str):
+    """Drop cached start times for audio_id (e.g. after segments are reloaded)."""
+    _SEG_STARTS_CACHE.pop(audio_id, None)
+
+
+def find_active_segment(segments: list, seg_starts: np.ndarray, t: float):
+    """
+    Find the segment containing time t using binary search over seg_starts.
+    
+    Matches the first segment with start <= t <= end, so a time exactly on a
+    shared boundary resolves to the earlier segment.
+    
+    Args:
+        segments: List of segment dicts sorted by start time
+        seg_starts: Start times from get_segment_starts
+        t: Playback time in seconds
+        
+    Returns:
+        The active segment dict, or None if t falls outside all segments
+    """
+    idx = int(np.searchsorted(seg_starts, t, side="right")) - 1
+    if idx < 0:
+        return None
+    if idx > 0 and segments[idx - 1]["end"] >= t:
+        idx -= 1
+    return segments[idx] if segments[idx]["end"] >= t else None
@@ -1,4 +1,6 @@
 import pytest
+import numpy as np
+from dashboard.utils.playback import find_active_segment, get_segment_starts
 
 
 def test_active_segment_match():
@@ -66,6 +68,35 @@ def test_empty_segments_list():
     assert active is None
 
 
+def test_find_active_segment_matches_linear_scan():
+    """Test binary-search lookup agrees with the linear scan, including boundaries and gaps."""
+    segments = [
+        {"start": 0.0, "end": 10.0, "id": "seg1"},
+        {"start": 10.0, "end": 20.0, "id": "seg2"},
+        {"start": 25.0, "end": 30.0, "id": "seg3"}
+    ]
+    seg_starts = np.array([s["start"] for s in segments])
+    
+    for current_time in [-1.0, 0.0, 5.0, 10.0, 15.0, 20.0, 22.0, 25.0, 30.0, 31.0]:
+        expected = next((s for s in segments if s["start"] <= current_time <= s["end"]), None)
+        assert find_active_segment(segments, seg_starts, current_time) is expected
+
+
+def test_find_active_segment_empty():
+    """Test binary-search lookup with no segments."""
+    assert find_active_segment([], np.array([]), 5.0) is None
+
+
+def test_segment_starts_rebuilt_when_bounds_change():
+    """Same segment count with shifted bounds must not reuse the cached start times."""
+    first = [{"start": 0.0, "end": 5.0}, {"start": 5.0, "end": 10.0}]
+    shifted = [{"start": 1.0, "end": 6.0}, {"start": 6.0, "end": 12.0}]
+    
+    assert get_segment_starts("sync-test", first).tolist() == [0.0, 5.0]
+    assert get_segment_starts("sync-test", list(first)) is get_segment_starts("sync-test", first)
+    assert get_segment_starts("sync-test", shifted).tolist() == [1.0, 6.0]
+
+
 @pytest.mark.skip(reason="Requires Dash testing framework with Selenium")
 def test_dashboard_callback_integration():
     """
@@ -0,0 +1,55 @@
+import json
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from app.main import app
+
+client = TestClient(app)
+
+
+class FakeRedis:
+    """In-memory stand-in for the get/set/delete calls the bundle endpoint makes."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value.encode() if isinstance(value, str) else value
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+
+@pytest.fixture(autouse=True)
+def redis_conn():
+    """Patch every module-level redis_conn the bundle routes read through."""
+    fake = FakeRedis()
+    with patch('app.routes.segments.redis_conn', fake), \
+         patch('app.routes.summary.redis_conn', fake), \
+         patch('app.services.summary_aggregator.redis_conn', fake):
+        yield fake
+
+def test_get_bundle_returns_segments_and_summary(redis_conn):
+    audio_id = "bundle123"
+    redis_conn.set(f"transcript_segments:{audio_id}", json.dumps([
+        {"start": 0.0, "end": 10.0, "text": "Welcome to the show."},
+        {"start": 10.0, "end": 20.0, "text": "Talking about oat milk."}
+    ]))
+    redis_conn.set(f"classifier_output:{audio_id}", json.dumps([
+        {"topic": "Intro", "tone": "Neutral"},
+        {"topic": "Food", "tone": "Informative"}
+    ]))
+
+    response = client.get(f"/bundle/{audio_id}")
+    assert response.status_code == 200
+    bundle = response.json()
+    assert bundle["audio_id"] == audio_id
+    assert len(bundle["segments"]) == 2
+    assert bundle["summary"]["num_segments"] == 2
+
+def test_get_bundle_missing_data():
+    response = client.get("/bundle/missing_id")
+    assert response.status_code == 404
@@ -69,3 +69,34 @@ def test_render_metadata_with_complex_scores():
     
     result = render_metadata_panel(segment)
     assert result is not None
+
+
+def test_get_score_color_thresholds():
+    """Integer lookup and fractional fallback agree on the score thresholds."""
+    from dashboard.components.metadata_panel import get_score_color
+    
+    assert [get_score_color(s) for s in range(6)] == ["#ef4444"] * 3 + ["#f59e0b"] + ["#10b981"] * 2
+    assert get_score_color(3.0) == "#f59e0b"
+    assert get_score_color(3.5) == "#ef4444"
+    assert get_score_color(4.5) == "#10b981"
+
+
+def test_render_persona_card_reuses_identical_cards():
+    """Identical persona results return the memoized card tree."""
+    from dashboard.components.metadata_panel import render_persona_card
+    
+    data = {"score": 4, "opinion": "Relatable", "rationale": "Clear", "confidence": 0.8, "note": ""}
+    first = render_persona_card("Gen Z", data, "🧑")
+    assert render_persona_card("Gen Z", dict(data), "🧑") is first
+    assert render_persona_card("Gen Z", {**data, "score": 4.0}, "🧑") is not first
+
+
+def test_instrumental_detection_trims_whitespace():
+    """Short or whitespace-padded transcripts count as instrumental."""
+    from dashboard.components.metadata_panel import _is_instrumental
+    
+    assert _is_instrumental("")
+    assert _is_instrumental("la la la")
+    assert _is_instrumental(" " * 30 + "hi" + " " * 30)
+    assert not _is_instrumental("A full sentence of spoken words here.")
+    assert not _is_instrumental(" A full sentence of spoken words here. ")
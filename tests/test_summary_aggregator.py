@@ -0,0 +1,19 @@
+from app.services.summary_aggregator import (
+    compute_score_distribution,
+    get_top_n_segments,
+    get_worst_n_segments,
+)
+
+
+def test_compute_score_distribution():
+    """Counts each 1-5 score and ignores anything else."""
+    assert compute_score_distribution([3, 4, 2, 5, 4, 0]) == {"1": 0, "2": 1, "3": 1, "4": 2, "5": 1}
+
+
+def test_top_and_worst_segments():
+    """Top/worst indices follow score order, earliest segment first on ties."""
+    scores = [2, 4, 3, 5, 1, 5, 3]
+    assert get_top_n_segments(scores, n=3) == [3, 5, 1]
+    assert get_worst_n_segments(scores, n=2) == [4, 0]
+    assert get_top_n_segments([], n=3) == []
+    assert get_worst_n_segments([3, 3, 3], n=2) == [0, 1]
@@ -0,0 +1,94 @@
+from dashboard.components.summary_panel import (
+    render_collapsible_summary,
+    render_detailed_summary,
+)
+
+PERSONAS = [
+    {"id": "genz", "display_name": "Gen Z", "emoji": "🔥", "description": "Teens"},
+    {"id": "advertiser", "display_name": "Advertiser", "emoji": "💼", "description": "Brands"},
+]
+SUMMARY = {
+    "audio_id": "test1",
+    "num_segments": 4,
+    "personas": {
+        "genz": {
+            "avg_score": 3.5,
+            "avg_confidence": 0.8,
+            "score_distribution": {"1": 0, "2": 1, "3": 1, "4": 1, "5": 1},
+            "top_segments": [3, 2],
+            "worst_segments": [0]
+        }
+    }
+}
+
+
+def test_render_collapsible_summary():
+    """Only personas with summary stats get a card."""
+    panel = render_collapsible_summary(PERSONAS, SUMMARY)
+    content = panel.children[1]
+    assert content.id == "summary-collapse-content"
+    assert len(content.children) == 1
+
+
+def test_render_summary_without_data():
+    """Missing summary data renders a placeholder instead of failing."""
+    assert render_collapsible_summary(PERSONAS, None) is not None
+    assert render_detailed_summary(PERSONAS, {}) is not None
+
+
+def test_detailed_card_uses_static_distribution_svg():
+    """The detailed view draws the distribution as an inline SVG image."""
+    from urllib.parse import unquote
+    from dashboard.components.summary_panel import distribution_svg_src
+    
+    src = distribution_svg_src({"1": 1, "4": 3})
+    assert src.startswith("data:image/svg+xml;utf8,")
+    svg = unquote(src.split(",", 1)[1])
+    assert svg.count("<rect") == 5
+    assert ">3</text>" in svg and ">5★</text>" in svg
+    
+    detailed = render_detailed_summary(PERSONAS, SUMMARY)
+    assert "data:image/svg+xml" in str(detailed.to_plotly_json())
+
+
+def test_score_color_bands():
+    """Scores map to red/orange/blue/green bands at 2, 3 and 4."""
+    from dashboard.components.summary_panel import get_score_color
+    
+    assert get_score_color(1.9) == get_score_color(0) == "#ef4444"
+    assert get_score_color(2.0) == "#f59e0b"
+    assert get_score_color(3.99) == "#3b82f6"
+    assert get_score_color(4.0) == get_score_color(5.0) == "#10b981"
+    assert get_score_color(float("nan")) == get_score_color(float("inf")) == "#6b7280"
+
+
+def test_persona_summary_card_cached_per_content():
+    """Identical persona + stats reuse the card; any displayed change rebuilds it."""
+    from dashboard.components.summary_panel import render_persona_summary_card
+    
+    persona, stats = PERSONAS[0], SUMMARY["personas"]["genz"]
+    card = render_persona_summary_card(persona, stats, compact=True)
+    assert render_persona_summary_card(dict(persona), dict(stats), compact=True) is card
+    assert render_persona_summary_card(persona, stats, compact=False) is not card
+    assert render_persona_summary_card({**persona, "display_name": "Zoomers"}, stats, compact=True) is not card
+    assert render_persona_summary_card(persona, {**stats, "top_segments": [1]}, compact=True) is not card
+
+
+def test_personas_without_scores():
+    """Zero-filled stats are skipped in the panel and shown as a placeholder in the detailed view."""
+    empty = {
+        "avg_score": 0,
+        "avg_confidence": 0,
+        "score_distribution": {"1": 0, "2": 0, "3": 0, "4": 0, "5": 0},
+        "top_segments": [],
+        "worst_segments": []
+    }
+    summary = {**SUMMARY, "personas": {**SUMMARY["personas"], "advertiser": empty}}
+    
+    content = render_collapsible_summary(PERSONAS, summary).children[1]
+    assert len(content.children) == 1
+    
+    cards = render_detailed_summary(PERSONAS, summary).children[1].children
+    assert len(cards) == 2
+    assert cards[0].className == "summary-card"
+    assert cards[1].className == "summary-card summary-card-empty"
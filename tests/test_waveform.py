@@ -1,4 +1,4 @@
-from dashboard.services.audio_utils import extract_waveform
+from dashboard.services.audio_utils import extract_waveform, load_waveform, minmax_downsample
 from dashboard.components.waveform import render_waveform_with_highlight
 import numpy as np
 from unittest.mock import patch
@@ -60,3 +60,64 @@ def test_render_empty_segments():
     
     fig = render_waveform_with_highlight(time, amplitude, segments)
     assert fig is not None
+
+
+def test_load_waveform_caches_to_disk(tmp_path):
+    """Test waveform is saved as float32 .npy and reused on the next load."""
+    from scipy.io import wavfile
+    audio_path = tmp_path / "sample.wav"
+    samples = (np.sin(np.linspace(0, 100, 8000)) * 16000).astype(np.int16)
+    wavfile.write(audio_path, 8000, samples)
+    
+    time, amplitude = load_waveform(audio_path)
+    cache_path = tmp_path / "sample.waveform.npy"
+    assert cache_path.exists()
+    assert amplitude.dtype == np.float32
+    
+    with patch("dashboard.services.audio_utils.extract_waveform") as mock_extract:
+        cached_time, cached_amplitude = load_waveform(audio_path)
+        mock_extract.assert_not_called()
+    
+    assert np.array_equal(cached_time, time)
+    assert np.array_equal(cached_amplitude, amplitude)
+
+
+def test_minmax_downsample_keeps_peaks():
+    """Test min/max envelope shrinks the series but preserves extremes."""
+    time = np.linspace(0, 10, 10000)
+    amplitude = np.sin(2 * np.pi * time)
+    amplitude[1234] = 5.0
+    
+    ds_time, ds_amplitude = minmax_downsample(time, amplitude, target_buckets=100)
+    
+    assert len(ds_time) == len(ds_amplitude) == 200
+    assert ds_amplitude.max() == 5.0
+    assert ds_amplitude.min() == amplitude.min()
+    assert np.all(np.diff(ds_time) >= 0)
+
+
+def test_minmax_downsample_short_input_unchanged():
+    """Test series already below the bucket count are returned as-is."""
+    time = np.linspace(0, 1, 50)
+    amplitude = np.cos(time)
+    
+    ds_time, ds_amplitude = minmax_downsample(time, amplitude, target_buckets=100)
+    
+    assert ds_time is time
+    assert ds_amplitude is amplitude
+
+
+def test_waveform_shapes_match_figure_shapes():
+    """Playback patches use the same shapes the full figure is built with."""
+    from dashboard.components.waveform import waveform_shapes
+    
+    time = np.linspace(0, 10, 100)
+    amplitude = np.sin(time)
+    segments = [{"start": 0.0, "end": 4.0}, {"start": 4.0, "end": 9.0}]
+    
+    fig = render_waveform_with_highlight(time, amplitude, segments, cursor_position=5.0, amp_min=-1.0, amp_max=1.0)
+    shapes = waveform_shapes(segments, 5.0, -1.0, 1.0)
+    
+    assert [shape["type"] for shape in shapes] == ["rect", "rect", "line"]
+    assert shapes[1]["fillcolor"] == "rgba(255, 0, 0, 0.4)"  # segment under the cursor
+    assert fig.to_dict()["layout"]["shapes"] == shapes